@@ -0,0 +1,97 @@
+# type: ignore
+
+"""Add timeseries aggregates, compression and retention
+
+Revision ID: 9ec29c13bc4d
+Revises: ddcb1954a9b4
+Create Date: 2026-10-18 15:02:27.118342
+
+The raw data retention can be set with `alembic -x timeseries_retention="180 days" upgrade head` (defaults to 1 year).
+The aggregates are kept forever.
+
+"""
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision = "9ec29c13bc4d"
+down_revision = "ddcb1954a9b4"
+branch_labels = None
+depends_on = None
+
+# table: segmentby column (the column used to filter the data)
+COMPRESSED_TABLES = {
+    "ts_guild_count": None,
+    "ts_command_usage": "guild_id",
+    "ts_setting_update": "guild_id",
+    "ts_poll_modification": "poll_id",
+}
+
+
+def upgrade() -> None:
+    retention = context.get_x_argument(as_dictionary=True).get("timeseries_retention", "365 days")
+
+    # Continuous aggregates cannot be created in a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE MATERIALIZED VIEW ts_command_usage_hourly
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT
+                time_bucket(INTERVAL '1 hour', ts) AS bucket,
+                data ->> 'command' AS command,
+                data ->> 'locale' AS locale,
+                guild_id,
+                count(*) AS uses
+            FROM ts_command_usage
+            GROUP BY bucket, command, locale, guild_id
+            WITH NO DATA;
+            """
+        )
+        op.execute(
+            """
+            CREATE MATERIALIZED VIEW ts_command_usage_daily
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT
+                time_bucket(INTERVAL '1 day', bucket) AS bucket,
+                command,
+                locale,
+                guild_id,
+                sum(uses)::BIGINT AS uses
+            FROM ts_command_usage_hourly
+            GROUP BY 1, command, locale, guild_id
+            WITH NO DATA;
+            """
+        )
+
+    op.execute(
+        "SELECT add_continuous_aggregate_policy('ts_command_usage_hourly', start_offset => INTERVAL '3 days', "
+        "end_offset => INTERVAL '1 hour', schedule_interval => INTERVAL '30 minutes');"
+    )
+    op.execute(
+        "SELECT add_continuous_aggregate_policy('ts_command_usage_daily', start_offset => INTERVAL '7 days', "
+        "end_offset => INTERVAL '1 day', schedule_interval => INTERVAL '1 hour');"
+    )
+
+    for table, segmentby in COMPRESSED_TABLES.items():
+        options = "timescaledb.compress, timescaledb.compress_orderby = 'ts DESC'"
+        if segmentby is not None:
+            options += f", timescaledb.compress_segmentby = '{segmentby}'"
+        op.execute(f"ALTER TABLE {table} SET ({options});")
+        op.execute(f"SELECT add_compression_policy('{table}', INTERVAL '7 days');")
+        op.execute(f"SELECT add_retention_policy('{table}', INTERVAL '{retention}');")
+
+    # Materialize the existing data once, the policies only refresh the recent buckets.
+    with op.get_context().autocommit_block():
+        op.execute("CALL refresh_continuous_aggregate('ts_command_usage_hourly', NULL, NULL);")
+        op.execute("CALL refresh_continuous_aggregate('ts_command_usage_daily', NULL, NULL);")
+
+
+def downgrade() -> None:
+    for table in COMPRESSED_TABLES:
+        op.execute(f"SELECT remove_retention_policy('{table}', if_exists => true);")
+        op.execute(f"SELECT remove_compression_policy('{table}', if_exists => true);")
+        op.execute(f"SELECT decompress_chunk(chunk, if_compressed => true) FROM show_chunks('{table}') AS chunk;")
+        op.execute(f"ALTER TABLE {table} SET (timescaledb.compress = false);")
+
+    op.execute("DROP MATERIALIZED VIEW ts_command_usage_daily;")
+    op.execute("DROP MATERIALIZED VIEW ts_command_usage_hourly;")
@@ -0,0 +1,153 @@
+# type: ignore
+
+"""Promote ts_command_usage data keys to columns
+
+Revision ID: b8e9e78f56a6
+Revises: 9ec29c13bc4d
+Create Date: 2026-10-18 16:41:09.532871
+
+The existing rows are not converted here, run `main.py backfill-command-usage` (or `bin/backfill_command_usage.sh`)
+after the upgrade. It processes the rows in chunks, then refreshes the aggregates.
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b8e9e78f56a6"
+down_revision = "9ec29c13bc4d"
+branch_labels = None
+depends_on = None
+
+
+def create_aggregates(command: str, locale: str) -> None:
+    # Continuous aggregates cannot be created in a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"""
+            CREATE MATERIALIZED VIEW ts_command_usage_hourly
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT
+                time_bucket(INTERVAL '1 hour', ts) AS bucket,
+                {command} AS command,
+                {locale} AS locale,
+                guild_id,
+                count(*) AS uses
+            FROM ts_command_usage
+            GROUP BY bucket, {command}, {locale}, guild_id
+            WITH NO DATA;
+            """
+        )
+        op.execute(
+            """
+            CREATE MATERIALIZED VIEW ts_command_usage_daily
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT
+                time_bucket(INTERVAL '1 day', bucket) AS bucket,
+                command,
+                locale,
+                guild_id,
+                sum(uses)::BIGINT AS uses
+            FROM ts_command_usage_hourly
+            GROUP BY 1, command, locale, guild_id
+            WITH NO DATA;
+            """
+        )
+    op.execute(
+        "SELECT add_continuous_aggregate_policy('ts_command_usage_hourly', start_offset => INTERVAL '3 days', "
+        "end_offset => INTERVAL '1 hour', schedule_interval => INTERVAL '30 minutes');"
+    )
+    op.execute(
+        "SELECT add_continuous_aggregate_policy('ts_command_usage_daily', start_offset => INTERVAL '7 days', "
+        "end_offset => INTERVAL '1 day', schedule_interval => INTERVAL '1 hour');"
+    )
+
+
+def drop_aggregates() -> None:
+    op.execute("DROP MATERIALIZED VIEW ts_command_usage_daily;")
+    op.execute("DROP MATERIALIZED VIEW ts_command_usage_hourly;")
+
+
+def disable_compression() -> None:
+    # The primary key cannot be changed while the hypertable is compressed.
+    op.execute("SELECT remove_compression_policy('ts_command_usage', if_exists => true);")
+    op.execute(
+        "SELECT decompress_chunk(chunk, if_compressed => true) FROM show_chunks('ts_command_usage') AS chunk;"
+    )
+    op.execute("ALTER TABLE ts_command_usage SET (timescaledb.compress = false);")
+
+
+def enable_compression() -> None:
+    op.execute(
+        "ALTER TABLE ts_command_usage SET (timescaledb.compress, timescaledb.compress_orderby = 'ts DESC', "
+        "timescaledb.compress_segmentby = 'guild_id');"
+    )
+    op.execute("SELECT add_compression_policy('ts_command_usage', INTERVAL '7 days');")
+
+
+def upgrade() -> None:
+    drop_aggregates()
+    disable_compression()
+
+    # `ts` alone is not unique, two interactions can happen at the same time.
+    op.execute("CREATE SEQUENCE ts_command_usage_id_seq AS BIGINT;")
+    op.add_column(
+        "ts_command_usage",
+        sa.Column(
+            "id", sa.BigInteger(), server_default=sa.text("nextval('ts_command_usage_id_seq')"), nullable=False
+        ),
+    )
+    op.execute("ALTER SEQUENCE ts_command_usage_id_seq OWNED BY ts_command_usage.id;")
+    op.drop_constraint("ts_command_usage_pkey", "ts_command_usage", type_="primary")
+    op.create_primary_key("ts_command_usage_pkey", "ts_command_usage", ["ts", "id"])
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.add_column("ts_command_usage", sa.Column("command", sa.VARCHAR(), nullable=True))
+    op.add_column("ts_command_usage", sa.Column("exact_command", sa.VARCHAR(), nullable=True))
+    op.add_column("ts_command_usage", sa.Column("command_type", sa.SMALLINT(), nullable=True))
+    op.add_column("ts_command_usage", sa.Column("locale", sa.VARCHAR(), nullable=True))
+    op.create_index("ix_ts_command_usage_command_ts", "ts_command_usage", ["command", "ts"], unique=False)
+    op.create_index("ix_ts_command_usage_command_type_ts", "ts_command_usage", ["command_type", "ts"], unique=False)
+    op.create_index("ix_ts_command_usage_locale_ts", "ts_command_usage", ["locale", "ts"], unique=False)
+    # ### end Alembic commands ###
+
+    enable_compression()
+    create_aggregates("command", "locale")
+
+
+def downgrade() -> None:
+    drop_aggregates()
+    disable_compression()
+
+    op.execute(
+        """
+        UPDATE ts_command_usage
+        SET data = jsonb_build_object(
+            'command', command,
+            'exact_command', exact_command,
+            'type', CASE command_type WHEN 1 THEN 'chat_input' WHEN 2 THEN 'user' WHEN 3 THEN 'message' END,
+            'locale', locale,
+            'namespace', data
+        )
+        WHERE command IS NOT NULL;
+        """
+    )
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_index("ix_ts_command_usage_locale_ts", table_name="ts_command_usage")
+    op.drop_index("ix_ts_command_usage_command_type_ts", table_name="ts_command_usage")
+    op.drop_index("ix_ts_command_usage_command_ts", table_name="ts_command_usage")
+    op.drop_column("ts_command_usage", "locale")
+    op.drop_column("ts_command_usage", "command_type")
+    op.drop_column("ts_command_usage", "exact_command")
+    op.drop_column("ts_command_usage", "command")
+    # ### end Alembic commands ###
+
+    op.drop_constraint("ts_command_usage_pkey", "ts_command_usage", type_="primary")
+    op.create_primary_key("ts_command_usage_pkey", "ts_command_usage", ["ts"])  # fails if some timestamps collide
+    op.drop_column("ts_command_usage", "id")  # drops the sequence too
+
+    enable_compression()
+    create_aggregates("data ->> 'command'", "data ->> 'locale'")
+
@@ -0,0 +1,49 @@
+"""A minimal benchmark harness, so the suite runs offline without extra dependencies.
+
+A benchmark is a setup function, registered with `@benchmark(name)`, that returns the callable to time.
+The setup is not timed.
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+type Setup = Callable[[], Callable[[], Any]]
+
+BENCHMARKS: dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    def decorator(setup: Setup) -> Setup:
+        if name in BENCHMARKS:
+            raise ValueError(f"A benchmark named {name} already exists.")
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+def run_benchmark(name: str, repeat: int = 5, min_time: float = 0.2) -> dict[str, Any]:
+    """Time a registered benchmark.
+
+    Returns:
+        A JSON-compatible dict, with the times per call in nanoseconds.
+    """
+    timer = timeit.Timer(BENCHMARKS[name]())
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    per_call = [t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "name": name,
+        "number": number,
+        "repeat": repeat,
+        "min_ns": min(per_call),
+        "median_ns": statistics.median(per_call),
+    }
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from itertools import count
+from time import monotonic
+
+from _harness import benchmark
+
+from core.caches import SizedMapping, SizedSequence, TemporaryCache
+
+SIZES = (100, 10_000)
+EXPIRED_RATIOS = (0.0, 0.5, 1.0)
+
+
+def filled_cache(size: int, expired_ratio: float = 0.0) -> TemporaryCache[int, int]:
+    cache = TemporaryCache[int, int](60, max_size=size)
+    for i in range(size):
+        cache[i] = i
+    # The expiration order is the insertion order, so we age the first items.
+    past = monotonic() - 1
+    for i in range(int(size * expired_ratio)):
+        cache._cache[i] = cache._cache[i]._replace(deadline=past)  # pyright: ignore[reportPrivateUsage]
+    return cache
+
+
+for size in SIZES:
+
+    @benchmark(f"caches.TemporaryCache.get[hit,size={size}]")
+    def _(size: int = size):
+        cache = filled_cache(size)
+        key = size // 2
+        return lambda: cache[key]
+
+    @benchmark(f"caches.TemporaryCache.get[miss,size={size}]")
+    def _(size: int = size):
+        cache = filled_cache(size)
+        return lambda: cache.get(-1)
+
+    @benchmark(f"caches.TemporaryCache.set[evict,size={size}]")
+    def _(size: int = size):
+        cache = filled_cache(size)
+        keys = count(size)
+        return lambda: cache.__setitem__(next(keys), 0)
+
+    for ratio in EXPIRED_RATIOS:
+
+        @benchmark(f"caches.TemporaryCache.clean[size={size},expired={ratio}]")
+        def _(size: int = size, ratio: float = ratio):
+            cache = filled_cache(size, ratio)
+            template = cache._cache.copy()  # pyright: ignore[reportPrivateUsage]
+
+            def clean():
+                # The copy is included in the timing, compare with expired=0.0 to get the cleaning cost.
+                cache._cache = template.copy()  # pyright: ignore[reportPrivateUsage]
+                cache.clean()
+
+            return clean
+
+    @benchmark(f"caches.SizedMapping.append[evict,size={size}]")
+    def _(size: int = size):
+        mapping = SizedMapping[int, int](size)
+        for i in range(size):
+            mapping.append(i, i)
+        keys = count(size)
+        return lambda: mapping.append(next(keys), 0)
+
+    @benchmark(f"caches.SizedSequence.append[evict,size={size}]")
+    def _(size: int = size):
+        sequence = SizedSequence[int](size, list(range(size)))
+        return lambda: sequence.append(0)
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from _harness import benchmark
+
+from cogs.calculator.calcul import Calcul
+
+
+@benchmark("calculator.Calcul.string_process[simple]")
+def _():
+    return lambda: Calcul.string_process("1+2+3+4+5+6+7+8+9+10")
+
+
+@benchmark("calculator.Calcul.string_process[parentheses]")
+def _():
+    # Calcul doesn't support nested parentheses
+    return lambda: Calcul.string_process("2(3+4*5)*7+8*3.5e2-12/4")
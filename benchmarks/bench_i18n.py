@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from contextvars import copy_context
+
+from _harness import benchmark
+from discord import Interaction, Locale
+
+from core.i18n import current_locale, i18n
+
+
+def fake_interaction(locale: Locale) -> Interaction:
+    inter = Interaction.__new__(Interaction)
+    inter.locale = locale
+    return inter
+
+
+@benchmark("i18n[explicit_locale]")
+def _():
+    return lambda: i18n("Hello, World!", _locale=Locale.french)
+
+
+@benchmark("i18n[explicit_locale,format]")
+def _():
+    return lambda: i18n("Hello, {0}!", "World", _locale=Locale.french)
+
+
+@benchmark("i18n[from_interaction]")
+def _():
+    def render() -> str:
+        return i18n("Hello, World!")
+
+    def callback(inter: Interaction) -> str:  # like an app command callback
+        return render()
+
+    inter = fake_interaction(Locale.french)
+    return lambda: callback(inter)
+
+
+@benchmark("i18n[from_context]")
+def _():
+    # Like a command dispatched by the CustomCommandTree.
+    context = copy_context()
+    context.run(current_locale.set, Locale.french)
+    return lambda: context.run(i18n, "Hello, World!")
+
+
+@benchmark("i18n[no_interaction,silent]")
+def _():
+    return lambda: i18n("Hello, World!", _silent=True)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from _harness import benchmark
+from discord import Embed
+
+from cogs.translate import EmbedTranslation
+from cogs.translate.languages import Languages, LanguagesEnum
+
+
+def big_embed() -> Embed:
+    embed = Embed(title="A title" * 10, description="A description. " * 200)
+    embed.set_author(name="An author")
+    embed.set_footer(text="A footer")
+    for i in range(25):
+        embed.add_field(name=f"Field {i}", value="A value. " * 50)
+    return embed
+
+
+@benchmark("translate.EmbedTranslation.flat[fields=25]")
+def _():
+    tr_embed = EmbedTranslation(big_embed())
+    return tr_embed.flat
+
+
+@benchmark("translate.EmbedTranslation.reconstruct[fields=25]")
+def _():
+    tr_embed = EmbedTranslation(big_embed())
+    translations = list(tr_embed.flattened.values())
+    return lambda: tr_embed.reconstruct(translations)
+
+
+LANGUAGES = Languages(language.value for language in LanguagesEnum)
+LAST = list(LANGUAGES)[-1]
+
+for case, emote in (("first", "🇦🇮"), ("last", LAST.unicode_flag_emotes[0]), ("missing", "🇦🇫")):
+
+    @benchmark(f"translate.Languages.from_emote[{case}]")
+    def _(emote: str = emote):
+        return lambda: LANGUAGES.from_emote(emote)
+
+
+for case, code in (("first", "en-GB"), ("last", LAST.lang_code), ("missing", "xx")):
+
+    @benchmark(f"translate.Languages.from_code[{case}]")
+    def _(code: str = code):
+        return lambda: LANGUAGES.from_code(code)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from _harness import benchmark
+
+from core.utils import chunker, splitter
+
+SEQUENCE = list(range(10_000))
+
+
+@benchmark("utils.chunker[len=10000,size=100]")
+def _():
+    return lambda: list(chunker(SEQUENCE, 100))
+
+
+@benchmark("utils.splitter[len=10000,number=7]")
+def _():
+    return lambda: list(splitter(SEQUENCE, 7))
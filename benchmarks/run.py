@@ -0,0 +1,95 @@
+"""Run the benchmark suite and emit the results as JSON.
+
+Usage (from the repository root):
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --output after.json --compare before.json
+    python benchmarks/run.py --filter caches.
+
+Every `bench_*.py` module next to this file is imported, and the benchmarks they register are run.
+A benchmark that raises is reported with its error, and the exit code is 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+BENCHMARKS_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from _harness import BENCHMARKS, run_benchmark  # noqa: E402
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=BENCHMARKS_DIR, text=True).strip()  # noqa: S603, S607
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: list[dict[str, Any]], previous_path: Path) -> None:
+    previous = {r["name"]: r for r in json.loads(previous_path.read_text())["results"]}
+    print(f"{'benchmark':<50} {'before':>12} {'after':>12} {'ratio':>8}", file=sys.stderr)
+    for result in results:
+        old = previous.get(result["name"])
+        if old is None or "error" in old or "error" in result:
+            continue
+        ratio = result["min_ns"] / old["min_ns"]
+        print(
+            f"{result['name']:<50} {old['min_ns']:>10.0f}ns {result['min_ns']:>10.0f}ns {ratio:>7.2f}x",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", "-o", type=Path, help="Write the JSON there instead of stdout.")
+    parser.add_argument("--filter", "-k", default="", help="Only run the benchmarks whose name contains this.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--compare", type=Path, help="A previous JSON output to compare with.")
+    args = parser.parse_args()
+
+    for module in sorted(BENCHMARKS_DIR.glob("bench_*.py")):
+        importlib.import_module(module.stem)
+
+    results: list[dict[str, Any]] = []
+    for name in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        try:
+            results.append(run_benchmark(name, repeat=args.repeat))
+        except Exception as e:
+            results.append({"name": name, "error": repr(e)})
+            print(f"{name:<50} {'FAILED':>14} {e!r}", file=sys.stderr)
+        else:
+            print(f"{name:<50} {results[-1]['min_ns']:>12.0f}ns", file=sys.stderr)
+
+    output = json.dumps(
+        {
+            "revision": git_revision(),
+            "date": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "results": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+    if args.compare:
+        compare(results, args.compare)
+    if any("error" in result for result in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
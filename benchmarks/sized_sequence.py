@@ -0,0 +1,49 @@
+"""Append throughput of SizedSequence, compared to the previous list.pop(0) implementation.
+
+Run from the repository root: `python benchmarks/sized_sequence.py`
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+from core.caches import SizedSequence
+
+
+class ListSizedSequence:
+    """The previous implementation, kept for comparison."""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._internal: list[int] = []
+
+    def append(self, value: int):
+        if len(self._internal) >= self._max_size:
+            self._internal.pop(0)
+        return self._internal.append(value)
+
+
+def appends_per_second(sequence: SizedSequence[int] | ListSizedSequence, size: int) -> float:
+    # Fill the sequence first, we want to measure the appends that evict an item.
+    for i in range(size):
+        sequence.append(i)
+    count = max(100_000, size)
+    start = perf_counter()
+    for i in range(count):
+        sequence.append(i)
+    return count / (perf_counter() - start)
+
+
+def main():
+    print(f"{'size':>10} {'ring buffer':>16} {'list.pop(0)':>16}")
+    for size in (100, 10_000, 1_000_000):
+        ring = appends_per_second(SizedSequence[int](size), size)
+        # list.pop(0) is O(n): one million appends on a one million list would take minutes.
+        legacy = f"{appends_per_second(ListSizedSequence(size), size):>14,.0f}/s" if size <= 10_000 else "skipped"
+        print(f"{size:>10} {ring:>14,.0f}/s {legacy:>16}")
+
+
+if __name__ == "__main__":
+    main()
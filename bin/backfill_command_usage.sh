@@ -0,0 +1,2 @@
+docker compose --progress quiet up database -d --quiet-pull
+docker compose --progress quiet run --rm -t mybot python3 ./src/main.py backfill-command-usage "$@"
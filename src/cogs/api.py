@@ -9,7 +9,8 @@ from typing import TYPE_CHECKING, Concatenate, ParamSpec, TypeVar, cast
 from aiohttp import hdrs, web
 from psutil import Process
 
-from core import ExtendedCog, config
+from core import ExtendedCog, caches_stats, config
+from core.db.engine import pool_stats
 
 if TYPE_CHECKING:
     from mybot import MyBot
@@ -62,6 +63,18 @@ class API(ExtendedCog):
         rss = cast(int, Process(getpid()).memory_info().rss)  # pyright: ignore[reportUnknownMemberType]
         return web.Response(text=f"{round(rss / 1024 / 1024, 2)} MB")
 
+    @route(hdrs.METH_GET, "/caches")
+    async def caches(self, request: web.Request):
+        return web.json_response(caches_stats())
+
+    @route(hdrs.METH_GET, "/database")
+    async def database(self, request: web.Request):
+        return web.json_response(pool_stats(self.bot.db_engine))
+
+    @route(hdrs.METH_GET, "/timeseries")
+    async def timeseries(self, request: web.Request):
+        return web.json_response(self.bot.timeseries.stats())
+
 
 async def setup(bot: MyBot):
     await bot.add_cog(API(bot))
@@ -50,7 +50,7 @@ class UserFilter(Filter):
 
 
 class RoleFilter(Filter):
-    members_cache = SizedMapping[str, discord.Member](max_size=100)
+    members_cache = SizedMapping[str, discord.Member](max_size=100, name="clear.members_cache")
 
     def __init__(self, role_id: int):
         self.role_id = role_id
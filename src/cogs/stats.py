@@ -27,7 +27,7 @@ class Stats(ExtendedCog):
     async def on_guild_join(self, guild: discord.Guild):
         # TODO: send a message in the 'bot add' channel
         async with self.bot.async_session.begin() as session:
-            await self.bot.get_or_create_db(session, db.GuildDB, guild_id=guild.id)
+            await self.bot.ensure_db(session, db.GuildDB, guild_id=guild.id)
         await self.update_guild_count()
 
     @ExtendedCog.listener()
@@ -36,8 +36,7 @@ class Stats(ExtendedCog):
         await self.update_guild_count()
 
     async def update_guild_count(self):
-        async with self.bot.async_session.begin() as session:
-            session.add(db.TSGuildCount(value=len(self.bot.guilds)))
+        await self.bot.timeseries.emit(db.TSGuildCount, value=len(self.bot.guilds))
 
     @ExtendedCog.listener()
     async def on_interaction(self, inter: Interaction) -> None:
@@ -53,24 +52,16 @@ class Stats(ExtendedCog):
         if app_command is None:
             return
 
-        payload = {
-            "command": parent.name,
-            "exact_command": inter.command.qualified_name,
-            "type": app_command.type.name,
-            "locale": inter.locale.name,
-            "namespace": inter.namespace.__dict__,
-        }
-
-        async with self.bot.async_session.begin() as session:
-            if inter.guild:
-                await self.bot.get_or_create_db(session, db.GuildDB, guild_id=inter.guild.id)
-            session.add(
-                db.TSUsage(
-                    user_id=inter.user.id,
-                    guild_id=inter.guild.id if inter.guild else None,
-                    data=payload,
-                )
-            )
+        await self.bot.timeseries.emit(
+            db.TSUsage,
+            user_id=inter.user.id,
+            guild_id=inter.guild.id if inter.guild else None,
+            command=parent.name,
+            exact_command=inter.command.qualified_name,
+            command_type=app_command.type.value,
+            locale=inter.locale.name,
+            data=inter.namespace.__dict__,
+        )
 
     @app_commands.command(
         name=__("stats"),
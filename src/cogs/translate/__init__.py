@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
 import logging
+import sys
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -12,13 +14,23 @@ import discord
 from discord import Embed, Message, app_commands, ui
 from discord.app_commands import locale_str as __
 
-from core import ExtendedCog, MiscCommandContext, ResponseType, TemporaryCache, db, misc_command, response_constructor
+from core import (
+    ExtendedCog,
+    MiscCommandContext,
+    ResponseType,
+    TemporaryCache,
+    async_cached,
+    misc_command,
+    response_constructor,
+)
 from core.checkers import bot_required_permissions, check, is_activated_predicate, is_user_authorized_predicate
 from core.constants import EmbedsCharLimits
+from core.db.persistent_cache import PersistentCache
 from core.errors import BadArgument, NonSpecificError
 from core.i18n import _
 
-from .languages import Language
+from .languages import Language, Languages
+from .search import LanguageSearch
 
 if TYPE_CHECKING:
     from discord import Interaction, RawReactionActionEvent
@@ -34,7 +46,7 @@ logger = logging.getLogger(__name__)
 
 
 # fmt: off
-EVERY_FLAGS = (
+EVERY_FLAGS = frozenset((
     "🇦🇫", "🇦🇱", "🇩🇿", "🇦🇸", "🇦🇩", "🇦🇴", "🇦🇮", "🇦🇶", "🇦🇬", "🇦🇷", "🇦🇲", "🇦🇼", "🇦🇺", "🇦🇹",
     "🇦🇿", "🇧🇸", "🇧🇭", "🇧🇩", "🇧🇧", "🇧🇾", "🇧🇪", "🇧🇿", "🇧🇯", "🇧🇲", "🇧🇹", "🇧🇴", "🇧🇶", "🇧🇦",
     "🇧🇼", "🇧🇻", "🇧🇷", "🇮🇴", "🇧🇳", "🇧🇬", "🇧🇫", "🇧🇮", "🇰🇭", "🇨🇲", "🇨🇦", "🇨🇻", "🇰🇾", "🇨🇫",
@@ -53,7 +65,7 @@ EVERY_FLAGS = (
     "🇸🇷", "🇸🇯", "🇸🇿", "🇸🇪", "🇨🇭", "🇸🇾", "🇹🇼", "🇹🇯", "🇹🇿", "🇹🇭", "🇹🇱", "🇹🇬", "🇹🇰", "🇹🇴",
     "🇹🇹", "🇹🇳", "🇹🇷", "🇹🇲", "🇹🇨", "🇹🇻", "🇺🇬", "🇺🇦", "🇦🇪", "🇬🇧", "🇺🇸", "🇺🇲", "🇺🇾", "🇺🇿",
     "🇻🇺", "🇻🇦", "🇻🇪", "🇻🇳", "🇻🇬", "🇻🇮", "🇼🇫", "🇪🇭", "🇾🇪", "🇿🇲", "🇿🇼", "🇦🇽"
-)
+))
 # fmt: on
 
 
@@ -82,6 +94,20 @@ class TranslationTask:
             tr_embed.reconstruct(translation[i : i + len(tr_embed)])
             i += len(tr_embed)
 
+    def memory_usage(self) -> int:
+        """Approximate the memory used by the task, in bytes. Used to bound the translations cache."""
+        return sys.getsizeof(self.content) + sum(tr_embed.memory_usage() for tr_embed in self.tr_embeds)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"content": self.content, "embeds": [tr_embed.dict_embed for tr_embed in self.tr_embeds]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TranslationTask:
+        return cls(
+            content=data["content"],
+            tr_embeds=[EmbedTranslation(Embed.from_dict(embed)) for embed in data["embeds"]],
+        )
+
 
 class EmbedTranslation:
     def __init__(self, embed: Embed):
@@ -166,6 +192,20 @@ class EmbedTranslation:
     def embed(self) -> Embed:
         return Embed.from_dict(self.dict_embed)
 
+    def memory_usage(self) -> int:
+        """Approximate the memory used by the embed, in bytes. Only strings are counted, containers are negligible."""
+
+        def strings_size(obj: Any) -> int:
+            if isinstance(obj, str):
+                return sys.getsizeof(obj)
+            if isinstance(obj, dict):
+                return sum(strings_size(value) for value in obj.values())  # pyright: ignore[reportUnknownVariableType]
+            if isinstance(obj, list):
+                return sum(strings_size(value) for value in obj)  # pyright: ignore[reportUnknownVariableType]
+            return 0
+
+        return strings_size(self.dict_embed) + strings_size(self._flattened)
+
 
 class TempUsage:
     def __init__(self):
@@ -190,8 +230,29 @@ class TempUsage:
 class Translate(ExtendedCog):
     def __init__(self, bot: MyBot):
         super().__init__(bot)
-        self.cache: TemporaryCache[str, TranslationTask] = TemporaryCache(expire=timedelta(days=1), max_size=10_000)
+        self.cache: PersistentCache[str, TranslationTask] = PersistentCache(
+            "translate.cache",
+            expire=timedelta(days=1),
+            max_size=10_000,
+            max_bytes=64 * 1024 * 1024,  # 64 MiB
+            sizer=TranslationTask.memory_usage,
+            dump=TranslationTask.to_dict,
+            load=TranslationTask.from_dict,
+        )
+        # Content-addressed: the same text is translated once, whatever the message it comes from.
+        self.segments: PersistentCache[str, str] = PersistentCache(
+            "translate.segments",
+            expire=timedelta(days=7),
+            max_size=100_000,
+            max_bytes=32 * 1024 * 1024,  # 32 MiB
+        )
+        # Concurrent translations of the same message (e.g. many reactions at once) share the same call.
+        self.translate_message = async_cached(
+            self.cache, key=lambda message_id, task, to, from_: f"{message_id}:{to.lang_code}"
+        )(self._translate_message)
         self.tmp_user_usage = TempUsage()
+        self.languages: Languages  # the languages of the first translator, set in cog_load
+        self.language_search: LanguageSearch
 
         self.translators: list[TranslatorAdapter] = []
         for adapter in self.bot.config.translator_services:
@@ -209,16 +270,24 @@ class Translate(ExtendedCog):
             )
         )
 
+    async def cog_load(self) -> None:
+        self.languages = await self.translators[0].available_languages()
+        self.language_search = LanguageSearch(self.languages)
+        for cache in (self.cache, self.segments):
+            cache.start_sweeper(timedelta(minutes=10))
+            if not self.bot.config.export_mode:
+                cache.start(self.bot.async_session)  # the database is connected before the extensions are loaded
+
     async def cog_unload(self) -> None:
+        await self.cache.close()
+        await self.segments.close()
         for translator in self.translators:
             await translator.close()
 
-    async def public_translations(self, guild_id: int | None):
+    async def public_translations(self, guild_id: int | None) -> bool:
         if guild_id is None:  # we are in private channels, IG
             return True
-        async with self.bot.async_session.begin() as session:
-            guild_db = await self.bot.get_or_create_db(session, db.GuildDB, guild_id=guild_id)
-            return guild_db.translations_are_public
+        return (await self.bot.guild_settings.get(guild_id)).translations_are_public
 
     @app_commands.command(
         name=__("translate"),
@@ -226,13 +295,12 @@ class Translate(ExtendedCog):
         extras={"beta": True},
     )
     async def translate_slash(self, inter: Interaction, to: str, text: str, from_: str | None = None) -> None:
-        available_languages = await self.translators[0].available_languages()
-        to_language = available_languages.from_code(to)
+        to_language = self.languages.from_code(to)
         if to_language is None:
             raise BadArgument(_("The language you provided is not supported."))
 
         if from_ is not None:
-            from_language = available_languages.from_code(from_)
+            from_language = self.languages.from_code(from_)
             if from_language is None:
                 raise BadArgument(
                     _("The language you provided under the argument `from_` is not supported : {}", from_)
@@ -256,20 +324,14 @@ class Translate(ExtendedCog):
     @translate_slash.autocomplete("to")
     @translate_slash.autocomplete("from_")
     async def translate_slash_autocomplete_to(self, inter: Interaction, current: str) -> list[app_commands.Choice[str]]:
-        available_languages = await self.translators[0].available_languages()
+        return self.language_search.search(current)
 
-        return [
-            app_commands.Choice(name=lang.name, value=lang.lang_code)
-            for lang in available_languages
-            if lang.name.startswith(current)
-        ][:25]
-
-    async def translate_misc_condition(self, payload: RawReactionActionEvent) -> bool:
-        available_languages = await self.translators[0].available_languages()
+    def translate_misc_condition(self, payload: RawReactionActionEvent) -> bool:
+        # Called for every reaction added, everywhere.
         return (
             payload.emoji.is_unicode_emoji()
             and payload.emoji.name in EVERY_FLAGS
-            and available_languages.from_emote(payload.emoji.name) is not None
+            and self.languages.from_emote(payload.emoji.name) is not None
         )
 
     @misc_command(
@@ -289,12 +351,11 @@ class Translate(ExtendedCog):
         if TYPE_CHECKING:
             channel = cast(MessageableChannel, channel)
 
-        available_languages = await self.translators[0].available_languages()
-        language = available_languages.from_emote(payload.emoji.name)
+        language = self.languages.from_emote(payload.emoji.name)
         if language is None:
             raise ValueError(_("The language you asked for is not supported."))
 
-        message = await channel.fetch_message(payload.message_id)
+        message = await self.fetch_message(channel, payload.message_id)
 
         async def public_pre_strategy():
             await channel.typing()
@@ -320,8 +381,7 @@ class Translate(ExtendedCog):
 
     # command definition is in Translate.__init__ because of dpy limitation!
     async def translate_message_ctx(self, inter: Interaction, message: Message) -> None:
-        available_languages = await self.translators[0].available_languages()
-        to_language = available_languages.from_locale(inter.locale)
+        to_language = self.languages.from_locale(inter.locale)
         if not to_language:
             raise NonSpecificError(_("Your locale is not supported."))
 
@@ -386,15 +446,10 @@ class Translate(ExtendedCog):
         if from_ is None:
             from_ = await translator.detect(translation_task.values[0])
 
-        use_cache = message_reference is not None
-        if use_cache and (cached := self.cache.get(f"{message_reference.id}:{to.lang_code}")):
-            translation_task = cached
+        if message_reference is not None:
+            translation_task = await self.translate_message(message_reference.id, translation_task, to, from_)
         else:
-            translated_values = await translator.batch_translate(translation_task.values, to, from_)
-            translation_task.inject_translations(tuple(self.clean_translation(t) for t in translated_values))
-
-            if use_cache:
-                self.cache[f"{message_reference.id}:{to.lang_code}"] = translation_task
+            await self.translate_task(translation_task, to, from_)
 
         head = response_constructor(
             ResponseType.success,
@@ -410,6 +465,52 @@ class Translate(ExtendedCog):
 
         await send_strategies.send(embeds=[head, *[tr_embed.embed for tr_embed in translation_task.tr_embeds]])
 
+    async def _translate_message(
+        self, message_id: int, translation_task: TranslationTask, to: Language, from_: Language | None
+    ) -> TranslationTask:
+        """Translate a message, or get it from the database. Called through `translate_message`, which keeps the result
+        in the cache and merges the concurrent calls for the same message and language.
+        """
+        if (cached := await self.cache.fetch(f"{message_id}:{to.lang_code}")) is not None:
+            return cached  # the same object, so storing it back in the cache doesn't write it to the database again
+        await self.translate_task(translation_task, to, from_)
+        return translation_task
+
+    async def translate_task(self, translation_task: TranslationTask, to: Language, from_: Language | None) -> None:
+        translated_values = await self.translate_segments(self.translators[0], translation_task.values, to, from_)
+        translation_task.inject_translations(translated_values)
+
+    @async_cached(
+        TemporaryCache(30, max_size=1_000, name="translate.messages"),  # 30 seconds
+        key=lambda self, channel, message_id: message_id,
+    )
+    async def fetch_message(self, channel: MessageableChannel, message_id: int) -> Message:
+        """Fetch a message, kept for a short time so a burst of reactions on the same message costs one request."""
+        return await channel.fetch_message(message_id)
+
+    async def translate_segments(
+        self, translator: TranslatorAdapter, values: Sequence[str], to: Language, from_: Language | None
+    ) -> list[str]:
+        """Translate the values of a task, using the segments cache. Only the missing values are sent to the
+        translator, in a single batch.
+        """
+        source = from_.lang_code if from_ else "auto"
+        keys = [self.segment_key(value, source, to.lang_code) for value in values]
+        found = await self.segments.fetch_many(keys)
+
+        missing = {key: value for key, value in zip(keys, values) if key not in found}  # also removes duplicates
+        if missing:
+            translated_values = await translator.batch_translate(list(missing.values()), to, from_)
+            for key, translated in zip(missing, translated_values):
+                found[key] = self.segments[key] = self.clean_translation(translated)
+
+        return [found[key] for key in keys]
+
+    @staticmethod
+    def segment_key(value: str, source: str, target: str) -> str:
+        digest = hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+        return f"{digest}:{source}:{target}"
+
     def clean_translation(self, translation: str) -> str:
         """This function will try to clean the translation by removing some spaces etc..."""
         translation = translation.replace("\xa0:", ":")
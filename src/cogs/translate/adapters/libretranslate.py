@@ -6,6 +6,7 @@ from typing import TypeVar
 
 from lingua import Language as LinguaLanguage, LanguageDetectorBuilder
 
+from core import config
 from libraries.libre_translate import Language as LibreLanguage, LibreTranslate
 
 from ..languages import Language, Languages, LanguagesEnum
@@ -58,34 +59,35 @@ language_to_libre = {
 class Translator(TranslatorAdapter):
     def __init__(self):
         self.instance = LibreTranslate("https://translate.argosopentech.com/")
+        # Shared by every translation, so a big message doesn't flood the host.
+        self.semaphore = asyncio.Semaphore(config.libretranslate_max_concurrency)
         self.detector = (
             LanguageDetectorBuilder.from_languages(*lingua_to_language.keys())
             .with_low_accuracy_mode()
             .with_minimum_relative_distance(0.8)
             .build()
         )
+        self.languages = Languages(x.value for x in language_to_libre)
 
     async def close(self):
         await self.instance.close()
 
     async def available_languages(self) -> Languages:
-        return Languages(x.value for x in language_to_libre)
+        return self.languages
 
     async def translate(self, text: str, to: Language, from_: Language | None = None) -> str:
-        return await self.instance.translate(
-            text, language_to_libre[LanguagesEnum(to)], language_to_libre[LanguagesEnum(from_)] if from_ else "auto"
-        )
+        async with self.semaphore:
+            return await self.instance.translate(
+                text, language_to_libre[LanguagesEnum(to)], language_to_libre[LanguagesEnum(from_)] if from_ else "auto"
+            )
 
     async def batch_translate(self, texts: Sequence[str], to: Language, from_: Language | None = None) -> list[str]:
-        return await asyncio.gather(
-            *[
-                self.instance.translate(
-                    text,
-                    language_to_libre[LanguagesEnum(to)],
-                    language_to_libre[LanguagesEnum(from_)] if from_ else "auto",
-                )
-                for text in texts
-            ]
+        return await self.instance.batch_translate(
+            texts,
+            language_to_libre[LanguagesEnum(to)],
+            language_to_libre[LanguagesEnum(from_)] if from_ else "auto",
+            max_chars=config.libretranslate_batch_chars,
+            semaphore=self.semaphore,
         )
 
     async def detect(self, text: str) -> Language | None:
@@ -38,6 +38,7 @@ class Translator(TranslatorAdapter):
             .with_minimum_relative_distance(0.8)
             .build()
         )
+        self.languages = Languages(x.value for x in LanguagesEnum)
 
     async def close(self):
         await self.instance.close()
@@ -56,7 +57,7 @@ class Translator(TranslatorAdapter):
         return lingua_to_language[result].value
 
     async def available_languages(self) -> Languages:
-        return Languages(x.value for x in LanguagesEnum)
+        return self.languages
 
 
 def get_translator() -> type[TranslatorAdapter]:
@@ -4,6 +4,8 @@ from typing import NamedTuple
 
 from discord import Locale
 
+from core.i18n import _
+
 
 class Language(NamedTuple):
     name: str
@@ -25,7 +27,7 @@ class Language(NamedTuple):
 class LanguagesEnum(Enum):
     # fmt: off
     british_english = Language(
-        name="british english",
+        name=_("british english", _locale=None),
         discord_locale=Locale.british_english,
         unicode_flag_emotes=("🇦🇮", "🇦🇬", "🇦🇺", "🇧🇸", "🇧🇧", "🇧🇿", "🇧🇲", "🇧🇼", "🇮🇴", "🇨🇦", "🇰🇾",
                              "🇨🇽", "🇨🇨", "🇨🇰", "🇩🇲", "🇫🇰", "🇫🇯", "🇬🇲", "🇬🇭", "🇬🇮", "🇬🇩", "🇬🇺",
@@ -35,96 +37,96 @@ class LanguagesEnum(Enum):
                              "🇹🇴", "🇹🇹", "🇹🇨", "🇹🇻", "🇬🇧", "🇻🇬", "🇻🇮", "🇿🇲", "🏴󠁧󠁢󠁥󠁮󠁧󠁿"),
     )
     american_english = Language(
-        name="american english",
+        name=_("american english", _locale=None),
         discord_locale=Locale.american_english,
         unicode_flag_emotes=("🇺🇸", "🇺🇲"),
     )
     arabic = Language(
-        name="arabic",
+        name=_("arabic", _locale=None),
         ietf_bcp_47="ar-SA",
         unicode_flag_emotes=("🇩🇿", "🇧🇭", "🇰🇲", "🇩🇯", "🇪🇬", "🇪🇷", "🇯🇴", "🇰🇼", "🇱🇧", "🇱🇾", "🇲🇷",
                              "🇲🇦", "🇴🇲", "🇶🇦", "🇸🇦", "🇸🇩", "🇸🇾", "🇹🇳", "🇦🇪", "🇪🇭", "🇾🇪"),
     )
     chinese = Language(
-        name="chinese",
+        name=_("chinese", _locale=None),
         discord_locale=Locale.chinese,
         unicode_flag_emotes=("🇨🇳", "🇭🇰", "🇲🇴", "🇹🇼")
     )
     taiwan_chinese = Language(
-        name="chinese (taiwan)",
+        name=_("chinese (taiwan)", _locale=None),
         discord_locale=Locale.taiwan_chinese,
         unicode_flag_emotes=()
     )
     french = Language(
-        name="french",
+        name=_("french", _locale=None),
         discord_locale=Locale.french,
         unicode_flag_emotes=("🇧🇯", "🇧🇫", "🇧🇮", "🇨🇲", "🇨🇫", "🇹🇩", "🇨🇩", "🇨🇬", "🇨🇮", "🇬🇶", "🇫🇷",
                              "🇬🇫", "🇵🇫", "🇹🇫", "🇬🇦", "🇬🇵", "🇬🇳", "🇲🇱", "🇲🇶", "🇾🇹", "🇲🇨", "🇳🇨",
                              "🇳🇪", "🇷🇪", "🇧🇱", "🇲🇫", "🇵🇲", "🇸🇳", "🇸🇨", "🇹🇬", "🇻🇺", "🇼🇫")
     )
     german = Language(
-        name="german",
+        name=_("german", _locale=None),
         discord_locale=Locale.german,
         unicode_flag_emotes=("🇦🇹", "🇩🇪", "🇱🇮", "🇨🇭")
     )
     hindi = Language(
-        name="hindi",
+        name=_("hindi", _locale=None),
         discord_locale=Locale.hindi,
         unicode_flag_emotes=("🇮🇳",)
     )
     indonesian = Language(
-        name="indonesian",
+        name=_("indonesian", _locale=None),
         ietf_bcp_47="id-ID",
         unicode_flag_emotes=("🇮🇩",)
     )
     irish = Language(
-        name="irish",
+        name=_("irish", _locale=None),
         ietf_bcp_47="en-IE",
         unicode_flag_emotes=("🇮🇪",)
     )
     italian = Language(
-        name="italian",
+        name=_("italian", _locale=None),
         discord_locale=Locale.italian,
         unicode_flag_emotes=("🇮🇹", "🇸🇲", "🇻🇦")
     )
     japanese = Language(
-        name="japanese",
+        name=_("japanese", _locale=None),
         discord_locale=Locale.japanese,
         unicode_flag_emotes=("🇯🇵",)
     )
     korean = Language(
-        name="korean",
+        name=_("korean", _locale=None),
         discord_locale=Locale.korean,
         unicode_flag_emotes=("🇰🇵", "🇰🇷",)
     )
     polish = Language(
-        name="polish",
+        name=_("polish", _locale=None),
         discord_locale=Locale.polish,
         unicode_flag_emotes=("🇵🇱",)
     )
     brazil_portuguese = Language(
-        name="brazil portuguese",
+        name=_("brazil portuguese", _locale=None),
         discord_locale=Locale.brazil_portuguese,
         unicode_flag_emotes=("🇦🇴", "🇧🇷", "🇨🇻", "🇬🇼", "🇲🇿", "🇵🇹", "🇸🇹", "🇹🇱")
     )
     russian = Language(
-        name="russian",
+        name=_("russian", _locale=None),
         discord_locale=Locale.russian,
         unicode_flag_emotes=("🇦🇶", "🇷🇺")
     )
     spanish = Language(
-        name="spanish",
+        name=_("spanish", _locale=None),
         discord_locale=Locale.spain_spanish,
         unicode_flag_emotes=("🇦🇷", "🇧🇴", "🇨🇱", "🇨🇴", "🇨🇷", "🇨🇺", "🇩🇴", "🇪🇨", "🇸🇻", "🇬🇹", "🇭🇳",
                              "🇲🇽", "🇳🇮", "🇵🇦", "🇵🇾", "🇵🇪", "🇵🇷", "🇪🇸", "🇺🇾", "🇻🇪"),
     )
     turkish = Language(
-        name="turkish",
+        name=_("turkish", _locale=None),
         discord_locale=Locale.turkish,
         unicode_flag_emotes=("🇹🇷",)
     )
     vietnamese = Language(
-        name="vietnamese",
+        name=_("vietnamese", _locale=None),
         discord_locale=Locale.vietnamese,
         unicode_flag_emotes=("🇻🇳",)
     )
@@ -135,14 +137,25 @@ class Languages(Iterable[Language]):
     def __init__(self, languages: Iterable[Language]):
         self._languages = list(languages)
 
+        # Built once, the lookups are done on every reaction. The first language wins if several share a key.
+        self._by_locale: dict[Locale, Language] = {}
+        self._by_code: dict[str, Language] = {}
+        self._by_emote: dict[str, Language] = {}
+        for language in self._languages:
+            if language.discord_locale is not None:
+                self._by_locale.setdefault(language.discord_locale, language)
+            self._by_code.setdefault(language.lang_code, language)
+            for emote in language.unicode_flag_emotes:
+                self._by_emote.setdefault(emote, language)
+
     def __iter__(self) -> Iterator[Language]:
         return iter(self._languages)
 
-    def from_locale(self, locale: Locale) -> Language:
-        return next(x for x in self._languages if x.discord_locale == locale)
+    def from_locale(self, locale: Locale) -> Language | None:
+        return self._by_locale.get(locale)
 
     def from_code(self, lang_code: str) -> Language | None:
-        return next((x for x in self._languages if x.lang_code == lang_code), None)
+        return self._by_code.get(lang_code)
 
     def from_emote(self, unicode_emote_flag: str) -> Language | None:
-        return next((x for x in self._languages if unicode_emote_flag in x.unicode_flag_emotes), None)
+        return self._by_emote.get(unicode_emote_flag)
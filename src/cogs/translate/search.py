@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import unicodedata
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import NamedTuple
+
+from discord import app_commands
+
+from core import TemporaryCache, i18n
+
+from .languages import Language
+
+MAX_CHOICES = 25  # Discord limit
+
+
+class _Term(NamedTuple):
+    text: str  # normalized
+    rank: int  # lower is better
+    language: Language
+
+
+# The kind of term, in the order the matches are shown.
+_NAME = 1
+_CODE = 2
+_NAME_WORD = 3
+_LOCALIZED_NAME = 4
+
+
+def normalize(text: str) -> str:
+    """Casefold a text and remove its accents, so "Français" and "francais" are the same."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+class LanguageSearch:
+    """A prefix index over the languages names, codes and localized names (from the i18n catalogs), for the
+    autocomplete.
+
+    The terms are kept in a sorted list, the matches of a prefix are a contiguous slice found with a binary search.
+    The choices are built once per language, and the results are cached per query.
+    """
+
+    def __init__(self, languages: Iterable[Language]) -> None:
+        self._choices: dict[Language, app_commands.Choice[str]] = {
+            language: app_commands.Choice(name=language.name, value=language.lang_code) for language in languages
+        }
+
+        terms: set[_Term] = set()
+        for language in self._choices:
+            name = normalize(language.name)
+            terms.add(_Term(name, _NAME, language))
+            terms.add(_Term(normalize(language.lang_code), _CODE, language))
+            for word in name.split()[1:]:  # "brazil portuguese" is found with "portuguese"
+                terms.add(_Term(word.strip("()"), _NAME_WORD, language))
+            for catalog in i18n.catalogs.values():
+                if (localized := catalog.get(language.name)) is not None:
+                    terms.add(_Term(normalize(localized), _LOCALIZED_NAME, language))
+
+        self._terms = sorted(terms)
+        self._texts = [term.text for term in self._terms]
+        self._all = sorted(self._choices.values(), key=lambda choice: choice.name)[:MAX_CHOICES]
+        self._results: TemporaryCache[str, list[app_commands.Choice[str]]] = TemporaryCache(
+            timedelta(hours=1), max_size=2_000, name="translate.autocomplete"
+        )
+
+    def search(self, query: str) -> list[app_commands.Choice[str]]:
+        """Get the languages matching a query, the best matches first.
+
+        Args:
+            query: what the user typed, matched case and accent insensitively against the start of the terms.
+
+        Returns:
+            Up to 25 choices. The list is shared, it must not be modified.
+        """
+        prefix = normalize(query.strip())
+        if not prefix:
+            return self._all
+        if (cached := self._results.get(prefix)) is not None:
+            return cached
+
+        best: dict[Language, int] = {}
+        for term in self._terms[bisect_left(self._texts, prefix) :]:
+            if not term.text.startswith(prefix):
+                break
+            rank = 0 if term.text == prefix else term.rank  # exact matches first
+            if rank < best.get(term.language, rank + 1):
+                best[term.language] = rank
+
+        ordered = sorted(best, key=lambda language: (best[language], language.name))
+        result = self._results[prefix] = [self._choices[language] for language in ordered[:MAX_CHOICES]]
+        return result
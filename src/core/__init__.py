@@ -1,5 +1,12 @@
 from ._config import config as config
-from .caches import SizedMapping as SizedMapping, SizedSequence as SizedSequence, TemporaryCache as TemporaryCache
+from .caches import (
+    AsyncCached as AsyncCached,
+    SizedMapping as SizedMapping,
+    SizedSequence as SizedSequence,
+    TemporaryCache as TemporaryCache,
+    async_cached as async_cached,
+    caches_stats as caches_stats,
+)
 from .constants import Emojis as Emojis
 from .extended_commands import (
     ExtendedCog as ExtendedCog,
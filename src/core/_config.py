@@ -35,10 +35,30 @@ class Config:
     support_guild_id: int = 332209340780118016
     owners_ids: ClassVar[list[int]] = [341550709193441280, 329710312880340992]
     translator_services: ClassVar[list[str]] = ["libretranslate"]
+    libretranslate_max_concurrency: int = 4  # concurrent requests to the LibreTranslate host
+    libretranslate_batch_chars: int = 5000  # characters per request, keep it under the host `char_limit`
     extensions: ClassVar[list[str]] = []
     bot_id: int | None = None
     export_mode: bool = False
 
+    # Database engine, see core.db.engine
+    db_host: str = "database"
+    db_port: int = 5432
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 30 * 60  # seconds, -1 to disable
+    db_pool_timeout: float = 30  # seconds to wait for a connection from the pool
+    db_pool_pre_ping: bool = False  # test the connections on checkout (one more round trip per checkout)
+    db_prepared_statements: bool = True  # disable if the database is behind a transaction pooler (e.g. pgbouncer)
+    db_statement_cache_size: int = 100
+    db_command_timeout: float | None = 60  # seconds
+
+    # Time series (statistics) writes, see core.db.timeseries
+    telemetry_queue_size: int = 10_000
+    telemetry_batch_size: int = 500
+    telemetry_flush_interval: float = 5  # seconds
+    telemetry_overflow: str = "drop_oldest"  # or "block"
+
     _instance: ClassVar[Self] | None = None
     _defined: ClassVar[bool] = False
 
@@ -1,70 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import operator
+import sys
 from collections import OrderedDict
-from collections.abc import Callable, Iterator, Mapping, MutableMapping, Sequence
-from datetime import datetime, timedelta
-from functools import wraps
-from typing import Any, Concatenate, Generic, NamedTuple, ParamSpec, SupportsIndex, TypeVar, overload
+from collections.abc import Callable, Coroutine, Iterable, Iterator, Mapping, MutableMapping, Sequence
+from copy import copy
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from functools import partial, update_wrapper
+from itertools import chain, islice
+from time import monotonic
+from typing import Any, Concatenate, Generic, NamedTuple, ParamSpec, Protocol, Self, SupportsIndex, TypeVar, overload
+from weakref import WeakValueDictionary
 
 _K = TypeVar("_K")  # Type for Keys
 _V = TypeVar("_V")  # Type for Values
 _RT = TypeVar("_RT")  # Type for Return Type
-_ST = TypeVar("_ST", bound="TemporaryCache[Any, Any]")  # Type for Self
+_S = TypeVar("_S")  # Type for Self
 _P = ParamSpec("_P")  # Type for Args
+_P2 = ParamSpec("_P2")  # Type for Args (without self)
 
 T = TypeVar("T")  # Type for Generic
 
 
+@dataclass(slots=True)
+class CacheStats:
+    """Counters of a cache. Only named caches have statistics (see `caches_stats`)."""
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _InstrumentedCache(Protocol):
+    stats: CacheStats | None
+
+    def __len__(self) -> int: ...
+
+    def memory_usage(self) -> int: ...
+
+
+_registry: WeakValueDictionary[str, _InstrumentedCache] = WeakValueDictionary()
+
+
+def _register(name: str | None, cache: _InstrumentedCache) -> CacheStats | None:
+    if name is None:
+        return None
+    _registry[name] = cache
+    return CacheStats()
+
+
+def _shallow_size(objects: Iterable[Any]) -> int:
+    return sum(sys.getsizeof(obj) for obj in objects)
+
+
+def caches_stats() -> dict[str, dict[str, int | float]]:
+    """Dump the statistics of every named cache alive in the process.
+
+    Returns:
+        A dict with the cache names as keys, and their counters, hit ratio, current size and approximate memory usage
+        (in bytes, shallow) as values.
+    """
+    result: dict[str, dict[str, int | float]] = {}
+    for name, cache in sorted(_registry.items()):
+        stats = cache.stats or CacheStats()
+        result[name] = {
+            **asdict(stats),
+            "hit_ratio": stats.hit_ratio,
+            "size": len(cache),
+            "memory": cache.memory_usage(),
+        }
+    return result
+
+
 class TemporaryCache(Mapping[_K, _V]):
     """Create a temporary cache working like python's dict.
-    Every time the cache is accessed / modified, it will be cleaned.
+
+    Every item expires after the same delay, so the insertion order (kept by an OrderedDict) is also the expiration
+    order. Overwritten keys are moved to the end to keep this property.
+
+    Lookups only check the expiration of the requested item, so they cost a single dict probe. Expired items are
+    removed lazily, when new items are set, and periodically if a sweeper is started with `start_sweeper`.
 
     It implements the Mapping ABC, so it can be used like a dict.
     __contains__, keys, items, values, get, setdefault, __eq__, __ne__ are well defined.
 
-    get is also a cleaner, because it call __getitem__.
-    """
+    If a name is given, the cache keeps statistics and is listed by `caches_stats`.
 
-    @staticmethod
-    def as_cleaner(func: Callable[Concatenate[_ST, _P], _RT]) -> Callable[Concatenate[_ST, _P], _RT]:
-        """A decorator to tell that a method should clean the cache before executing."""
-
-        @wraps(func)
-        def inner(self: _ST, *args: _P.args, **kwargs: _P.kwargs) -> _RT:
-            self.clean()
-            return func(self, *args, **kwargs)
-
-        return inner
+    The cache can also be bounded in memory with `max_bytes`: the size of every value is computed once with `sizer`
+    when it is set, and the oldest items (which are also the first to expire) are evicted until the total fits.
+    """
 
-    def __init__(self, expire: timedelta | int, max_size: int | None = None) -> None:
+    def __init__(
+        self,
+        expire: timedelta | int,
+        max_size: int | None = None,
+        name: str | None = None,
+        max_bytes: int | None = None,
+        sizer: Callable[[_V], int] = sys.getsizeof,
+    ) -> None:
         """Initialize the cache.
 
         Args:
             expire (timedelta | int): The time after which the cache will be cleaned.
             max_size (int | None, optional): The maximum size of the cache (in number of elements). Defaults to None.
+            name (str | None, optional): A name to enable and register the statistics. Defaults to None.
+            max_bytes (int | None, optional): The maximum memory used by the values, in bytes. Defaults to None.
+            sizer (Callable[[_V], int], optional): A function that returns the size of a value, in bytes. Only used
+                with `max_bytes`. Defaults to sys.getsizeof.
         """
         self._cache: OrderedDict[_K, _CachedValue[_V]] = OrderedDict()
-        self._expire: timedelta = expire if isinstance(expire, timedelta) else timedelta(seconds=expire)
+        self._expire: float = expire.total_seconds() if isinstance(expire, timedelta) else float(expire)
         self._max_size: int | None = max_size
+        self._max_bytes: int | None = max_bytes
+        self._sizer: Callable[[_V], int] = sizer
+        self._bytes: int = 0
+        self._sweeper: asyncio.Task[None] | None = None
+        self.stats: CacheStats | None = _register(name, self)
 
     def __iter__(self) -> Iterator[_K]:
-        """Iterate over the keys of the cache. Works like dict.__iter__. (Is literally dict.__iter__)
+        """Iterate over the keys of the cache. Works like dict.__iter__.
+        Will clean the cache before, so expired keys are never yielded.
 
         Returns:
             Iteraror[_K]: An instanced iterator that iter over the keys.
         """
+        self.clean()
         return iter(self._cache)
 
     def __len__(self) -> int:
-        """Get the length of the cache. Works like dict.__len__. (Is literally dict.__len__)"""
+        """Get the length of the cache. Works like dict.__len__.
+        Will clean the cache before, so expired items are not counted.
+        """
+        self.clean()
         return self._cache.__len__()
 
     def __repr__(self) -> str:
         """Get the representation of the cache."""
         return repr({key: value.value for key, value in self._cache.items()})
 
-    @as_cleaner
     def __getitem__(self, key: _K) -> _V:
-        """Get an item from the cache. Works like dict.__getitem__. (Is literally dict.__getitem__).
-        Will clean the cache before.
+        """Get an item from the cache. Works like dict.__getitem__.
+        Only the requested item is checked, and removed if it has expired.
 
         Args:
             key (_K): The key of the item to get.
@@ -73,14 +157,26 @@ class TemporaryCache(Mapping[_K, _V]):
             _V: The value of the item.
 
         Raises:
-            KeyError: If the key is not in the cache.
+            KeyError: If the key is not in the cache, or has expired.
         """
-        return self._cache.__getitem__(key).value
+        cached_value = self._cache.get(key)
+        if cached_value is not None and cached_value.deadline < monotonic():
+            del self._cache[key]
+            self._bytes -= cached_value.size
+            if self.stats is not None:
+                self.stats.expirations += 1
+            cached_value = None
+        if cached_value is None:
+            if self.stats is not None:
+                self.stats.misses += 1
+            raise KeyError(key)
+        if self.stats is not None:
+            self.stats.hits += 1
+        return cached_value.value
 
-    @as_cleaner
     def __setitem__(self, key: _K, value: _V) -> None:
         """Set an item in the cache. Works almost like dict.__setitem__.
-        Will clean the cache before.
+        The expiration delay is reset if the key was already present.
 
         Args:
             key (_K): The key of the item to set.
@@ -88,11 +184,17 @@ class TemporaryCache(Mapping[_K, _V]):
         """
         self._set(key, value)
 
-    def clean(self):
-        """Clean the cache : loop over the cache and remove the expired items."""
-        # Values are sorted by date, so we can just pop the first items until we find one that is not expired.
-        while len(self) > 0 and next(iter(self._cache.values())).date < datetime.now():
-            self._cache.popitem(last=False)
+    def clean(self) -> None:
+        """Clean the cache : remove the expired items."""
+        # Values are sorted by deadline, so we can just pop the first items until we find one that is not expired.
+        now = monotonic()
+        cache = self._cache
+        expired = 0
+        while cache and next(iter(cache.values())).deadline < now:
+            self._bytes -= cache.popitem(last=False)[1].size
+            expired += 1
+        if expired and self.stats is not None:
+            self.stats.expirations += expired
 
     def _set(self, key: _K, value: _V) -> None:
         """Private method to set an item in the cache.
@@ -101,15 +203,31 @@ class TemporaryCache(Mapping[_K, _V]):
             key (_K): The key of the item to set.
             value (_V): The value of the item to set.
         """
-        cached_value = _CachedValue(date=datetime.now() + self._expire, value=value)
-        if self._max_size and len(self) >= self._max_size:
-            self._cache.popitem(last=False)
-        self._cache[key] = cached_value
+        # Each item is popped at most once, so cleaning here is amortized O(1).
+        self.clean()
+        size = self._sizer(value) if self._max_bytes is not None else 0
+        if (previous := self._cache.pop(key, None)) is not None:
+            self._bytes -= previous.size
+        if self._max_bytes is not None and size > self._max_bytes:
+            return  # the value would not fit even in an empty cache
+
+        evicted = 0
+        if self._max_size:
+            while len(self._cache) >= self._max_size:
+                self._bytes -= self._cache.popitem(last=False)[1].size
+                evicted += 1
+        if self._max_bytes is not None:
+            while self._bytes + size > self._max_bytes:
+                self._bytes -= self._cache.popitem(last=False)[1].size
+                evicted += 1
+        if evicted and self.stats is not None:
+            self.stats.evictions += evicted
+
+        self._cache[key] = _CachedValue(deadline=monotonic() + self._expire, value=value, size=size)
+        self._bytes += size
 
-    @as_cleaner
     def setdefault(self, key: _K, value: _V) -> None:
         """Set an item in the cache if the key is not already present. Works like dict.setdefault.
-        Will clean the cache before.
 
         Args:
             key (_K): The key of the item to set.
@@ -120,22 +238,87 @@ class TemporaryCache(Mapping[_K, _V]):
 
         self._set(key, value)
 
+    def pop(self, key: _K, default: _V | None = None) -> _V | None:
+        """Remove an item from the cache and return its value. Works like dict.pop, but never raises.
+
+        Args:
+            key (_K): The key of the item to remove.
+            default (_V | None, optional): The value returned if the key is not in the cache. Defaults to None.
+        """
+        cached_value = self._cache.pop(key, None)
+        if cached_value is None:
+            return default
+        self._bytes -= cached_value.size
+        return cached_value.value
+
+    def memory_usage(self) -> int:
+        """Get the approximate memory usage of the cache, in bytes.
+
+        If the cache is bounded with `max_bytes`, this is the total computed by the sizer. Otherwise, this is the
+        shallow size of the keys and values.
+        """
+        if self._max_bytes is not None:
+            return self._bytes
+        values = (cached_value.value for cached_value in self._cache.values())
+        return sys.getsizeof(self._cache) + _shallow_size(self._cache) + _shallow_size(values)
+
+    def start_sweeper(self, interval: timedelta | float = 60) -> None:
+        """Start a background task that periodically removes the expired items.
+
+        Must be called from a running event loop. Calling it while a sweeper is running does nothing.
+
+        Args:
+            interval (timedelta | float, optional): The time between two sweeps. Defaults to 60 seconds.
+        """
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+        seconds = interval.total_seconds() if isinstance(interval, timedelta) else interval
+        self._sweeper = asyncio.get_running_loop().create_task(self._sweep(seconds))
+
+    def stop_sweeper(self) -> None:
+        """Stop the background sweeper, if any."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+    async def _sweep(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.clean()
+
 
 class _CachedValue(NamedTuple, Generic[_V]):
-    date: datetime
+    deadline: float  # time.monotonic() based
     value: _V
+    size: int = 0  # only computed if the cache has a max_bytes
 
 
 class SizedSequence(Sequence[T]):
-    def __init__(self, max_size: int, init: Sequence[T] | None = None) -> None:
+    """A sequence with a maximum size. When it is full, appending a value removes the oldest one.
+
+    It is backed by a ring buffer, so append and indexed access are O(1). Slicing only copies the selected items.
+    """
+
+    def __init__(self, max_size: int, init: Sequence[T] | None = None, name: str | None = None) -> None:
         self._max_size: int = max_size
+        self._start: int = 0  # index of the oldest item in the buffer
+        self.stats: CacheStats | None = _register(name, self)
 
         if init is None:
-            self._internal: list[T] = []
+            self._buffer: list[T] = []
         elif len(init) > max_size:
             raise ValueError("The initial sequence is too long.")
         else:
-            self._internal = list(init)
+            self._buffer = list(init)
+
+    def _position(self, index: SupportsIndex) -> int:
+        i = operator.index(index)
+        length = len(self._buffer)
+        if i < 0:
+            i += length
+        if not 0 <= i < length:
+            raise IndexError("SizedSequence index out of range")
+        return (self._start + i) % length
 
     @overload
     def __getitem__(self, i: SupportsIndex) -> T: ...
@@ -144,33 +327,61 @@ class SizedSequence(Sequence[T]):
     def __getitem__(self, i: slice) -> Sequence[T]: ...
 
     def __getitem__(self, i: SupportsIndex | slice) -> T | Sequence[T]:
-        return self._internal.__getitem__(i)
+        if isinstance(i, slice):
+            buffer, start, length = self._buffer, self._start, len(self._buffer)
+            return [buffer[(start + j) % length] for j in range(*i.indices(length))]
+        return self._buffer[self._position(i)]
 
     def __setitem__(self, index: int, value: T):
-        return self._internal.__setitem__(index, value)
+        self._buffer[self._position(index)] = value
 
     def __delitem__(self, index: int):
-        return self._internal.__delitem__(index)
+        # Deleting is rare, so the buffer is simply linearized. O(n).
+        i = (self._position(index) - self._start) % len(self._buffer)
+        self._buffer = self._buffer[self._start :] + self._buffer[: self._start]
+        del self._buffer[i]
+        self._start = 0
 
     def __len__(self):
-        return self._internal.__len__()
+        return len(self._buffer)
+
+    def __iter__(self) -> Iterator[T]:
+        return chain(islice(self._buffer, self._start, None), islice(self._buffer, self._start))
 
     def append(self, value: T):
-        if len(self) >= self._max_size:
-            self._internal.pop(0)
-        return self._internal.append(value)
+        if len(self._buffer) < self._max_size:
+            self._buffer.append(value)
+            return
+        if self._max_size <= 0:
+            return
+        self._buffer[self._start] = value
+        self._start = (self._start + 1) % self._max_size
+        if self.stats is not None:
+            self.stats.evictions += 1
+
+    def memory_usage(self) -> int:
+        return sys.getsizeof(self._buffer) + _shallow_size(self._buffer)
 
     def __repr__(self) -> str:
-        return self._internal.__repr__()
+        return list(self).__repr__()
 
 
 class SizedMapping(MutableMapping[_K, _V]):
-    def __init__(self, max_size: int) -> None:
+    def __init__(self, max_size: int, name: str | None = None) -> None:
         self._max_size: int = max_size
         self._internal = OrderedDict[_K, _V]()
+        self.stats: CacheStats | None = _register(name, self)
 
     def __getitem__(self, key: _K):
-        return self._internal[key]
+        if self.stats is None:
+            return self._internal[key]
+        try:
+            value = self._internal[key]
+        except KeyError:
+            self.stats.misses += 1
+            raise
+        self.stats.hits += 1
+        return value
 
     def __setitem__(self, key: _K, value: _V) -> None:
         self.append(key, value)
@@ -185,12 +396,142 @@ class SizedMapping(MutableMapping[_K, _V]):
         return iter(self._internal)
 
     def append(self, key: _K, value: _V) -> None:
-        if key in self:
+        if key in self._internal:
             self._internal.move_to_end(key)
             return
         if len(self) >= self._max_size:
             self._internal.popitem(last=False)
+            if self.stats is not None:
+                self.stats.evictions += 1
         self._internal[key] = value
 
+    def memory_usage(self) -> int:
+        return sys.getsizeof(self._internal) + _shallow_size(self._internal) + _shallow_size(self._internal.values())
+
     def __repr__(self) -> str:
         return self._internal.__repr__()
+
+
+_MISSING: Any = object()
+
+
+def _default_key(*args: Any, **kwargs: Any) -> Any:
+    return (args, tuple(sorted(kwargs.items())))
+
+
+def _is_none(result: Any) -> bool:
+    return result is None
+
+
+class AsyncCached(Generic[_K, _P, _RT]):
+    """A coroutine function whose results are memoized in a TemporaryCache. Use `async_cached` to create it.
+
+    Concurrent calls with the same key share the same in-flight call. Exceptions are propagated to every waiter and
+    are not cached.
+    """
+
+    def __init__(
+        self,
+        func: Callable[_P, Coroutine[Any, Any, _RT]],
+        cache: TemporaryCache[_K, _RT],
+        key: Callable[..., _K],
+        negative_cache: TemporaryCache[_K, _RT] | None,
+        is_negative: Callable[[_RT], bool],
+    ) -> None:
+        update_wrapper(self, func)
+        self.func = func
+        self.cache = cache
+        self.negative_cache = negative_cache
+        self._key = key
+        self._is_negative = is_negative
+        self._inflight: dict[_K, asyncio.Future[_RT]] = {}
+        self._bound_args: tuple[Any, ...] = ()
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any]) -> Self: ...
+
+    @overload
+    def __get__(
+        self: AsyncCached[_K, Concatenate[_S, _P2], _RT], instance: _S, owner: type[Any]
+    ) -> AsyncCached[_K, _P2, _RT]: ...
+
+    def __get__(self, instance: Any, owner: type[Any]) -> Any:
+        if instance is None:
+            return self
+        # The copy shares the caches and the in-flight calls, it only binds the instance.
+        bound = copy(self)
+        bound._bound_args = (instance,)
+        return bound
+
+    async def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> _RT:
+        args = self._bound_args + args  # pyright: ignore[reportAssignmentType]
+        key = self._key(*args, **kwargs)
+
+        if (result := self.cache.get(key, _MISSING)) is not _MISSING:
+            return result
+        if self.negative_cache is not None and (result := self.negative_cache.get(key, _MISSING)) is not _MISSING:
+            return result
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.func(*args, **kwargs))
+            self._inflight[key] = future
+            future.add_done_callback(partial(self._store, key))
+        # A cancelled waiter must not cancel the call for the others.
+        return await asyncio.shield(future)
+
+    def _store(self, key: _K, future: asyncio.Future[_RT]) -> None:
+        if self._inflight.get(key) is not future:
+            return  # invalidated while running
+        del self._inflight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        result = future.result()
+        if not self._is_negative(result):
+            self.cache[key] = result
+        elif self.negative_cache is not None:
+            self.negative_cache[key] = result
+
+    def invalidate(self, *args: _P.args, **kwargs: _P.kwargs) -> None:
+        """Forget the result for these arguments. A call currently running for them will not be cached."""
+        key = self._key(*(self._bound_args + args), **kwargs)
+        self._inflight.pop(key, None)
+        self.cache.pop(key)
+        if self.negative_cache is not None:
+            self.negative_cache.pop(key)
+
+
+def async_cached(
+    cache: TemporaryCache[_K, Any],
+    key: Callable[..., _K] = _default_key,
+    negative_cache: TemporaryCache[_K, Any] | None = None,
+    is_negative: Callable[[Any], bool] = _is_none,
+) -> Callable[[Callable[_P, Coroutine[Any, Any, _RT]]], AsyncCached[_K, _P, _RT]]:
+    """Memoize a coroutine function (or method) in a TemporaryCache, and merge concurrent calls for the same key.
+
+        ```py
+        class MyCog(ExtendedCog):
+            @async_cached(TemporaryCache(60), key=lambda self, user_id: user_id)
+            async def expensive(self, user_id: int) -> bool: ...
+
+            async def on_something(self, user_id: int):
+                self.expensive.invalidate(user_id)
+        ```
+
+    Args:
+        cache: the cache where the results are stored.
+        key: a function that takes the same arguments as the decorated one (self included) and returns the key.
+            Defaults to the arguments themselves.
+        negative_cache: the cache for negative results, usually with a shorter expiration. If None, negative results
+            are not cached. Defaults to None.
+        is_negative: a function that tells if a result is negative. Defaults to `result is None`.
+
+    Returns:
+        A decorator.
+    """
+
+    def decorator(func: Callable[_P, Coroutine[Any, Any, _RT]]) -> AsyncCached[_K, _P, _RT]:
+        return AsyncCached(func, cache, key, negative_cache, is_negative)
+
+    return decorator
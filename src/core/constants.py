@@ -158,16 +158,18 @@ class TranslationContextLimits(enum.Enum):
 
     @classmethod
     def from_location(cls, location: TranslationContextLocation) -> TranslationContextLimits | None:
-        translation_context_limits_bind = {
-            TranslationContextLocation.choice_name: TranslationContextLimits.CHOICE_NAME,
-            TranslationContextLocation.command_description: TranslationContextLimits.COMMAND_DESCRIPTION,
-            TranslationContextLocation.parameter_description: TranslationContextLimits.PARAMETER_DESCRIPTION,
-            TranslationContextLocation.parameter_name: TranslationContextLimits.PARAMETER_NAME,
-            TranslationContextLocation.command_name: TranslationContextLimits.COMMAND_NAME,
-            TranslationContextLocation.group_name: TranslationContextLimits.GROUP_NAME,
-            TranslationContextLocation.group_description: TranslationContextLimits.GROUP_DESCRIPTION,
-        }
-        return translation_context_limits_bind.get(location)
+        return _translation_context_limits_bind.get(location)
+
+
+_translation_context_limits_bind = {
+    TranslationContextLocation.choice_name: TranslationContextLimits.CHOICE_NAME,
+    TranslationContextLocation.command_description: TranslationContextLimits.COMMAND_DESCRIPTION,
+    TranslationContextLocation.parameter_description: TranslationContextLimits.PARAMETER_DESCRIPTION,
+    TranslationContextLocation.parameter_name: TranslationContextLimits.PARAMETER_NAME,
+    TranslationContextLocation.command_name: TranslationContextLimits.COMMAND_NAME,
+    TranslationContextLocation.group_name: TranslationContextLimits.GROUP_NAME,
+    TranslationContextLocation.group_description: TranslationContextLimits.GROUP_DESCRIPTION,
+}
 
 
 # keys are from discord.Permissions, so some can defer from the discord API
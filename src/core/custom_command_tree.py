@@ -7,6 +7,7 @@ import discord
 from discord.app_commands import CommandTree
 
 from .errors import BotUserNotPresent
+from .i18n import current_locale
 
 if TYPE_CHECKING:
     from discord import Interaction
@@ -31,6 +32,8 @@ class CustomCommandTree(CommandTree["MyBot"]):
         await self.client.error_handler.handle_app_command_error(interaction, error)
 
     async def interaction_check(self, inter: Interaction[MyBot], /) -> bool:
+        # The command callback and the error handler are executed in the same task.
+        current_locale.set(inter.locale)
         if inter.channel is None:
             return False
         if not inter.guild and inter.channel.type is not discord.ChannelType.private:
@@ -7,6 +7,7 @@ from sqlalchemy.orm import selectinload as selectinload
 
 from .tables import (
     Base as Base,
+    CacheEntry as CacheEntry,
     GuildDB as GuildDB,
     Poll as Poll,
     PollAnswer as PollAnswer,
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Move the keys of the old `data` format ({"command": ..., "namespace": {...}}) to the columns, for a chunk of rows
+# following the (ts, id) cursor. Returns the number of updated rows and the new cursor.
+_COMMAND_USAGE_CHUNK = text(
+    """
+    WITH batch AS (
+        SELECT ts, id FROM ts_command_usage
+        WHERE (ts, id) > (:after_ts, :after_id)
+        ORDER BY ts, id
+        LIMIT :chunk_size
+    ), updated AS (
+        UPDATE ts_command_usage AS usage
+        SET
+            command = usage.data ->> 'command',
+            exact_command = usage.data ->> 'exact_command',
+            command_type = CASE usage.data ->> 'type'
+                WHEN 'chat_input' THEN 1 WHEN 'user' THEN 2 WHEN 'message' THEN 3
+            END,
+            locale = usage.data ->> 'locale',
+            data = coalesce(usage.data -> 'namespace', '{}'::jsonb)
+        FROM batch
+        WHERE usage.ts = batch.ts AND usage.id = batch.id
+            AND usage.command IS NULL AND usage.data ->> 'command' IS NOT NULL
+        RETURNING 1
+    ), last AS (
+        SELECT ts, id FROM batch ORDER BY ts DESC, id DESC LIMIT 1
+    )
+    SELECT (SELECT count(*) FROM updated), last.ts, last.id FROM last
+    """
+)
+
+
+async def backfill_command_usage(engine: AsyncEngine, chunk_size: int = 10_000) -> int:
+    """Convert the `ts_command_usage` rows written before the migration b8e9e78f56a6, then refresh the aggregates.
+
+    Each chunk is committed separately, so the table is never locked for long and the function can be interrupted and
+    run again (already converted rows are skipped).
+
+    Args:
+        engine: the database engine.
+        chunk_size: the number of rows per transaction. Defaults to 10 000.
+
+    Returns:
+        The number of converted rows.
+    """
+    after_ts, after_id = datetime.min, 0
+    total = 0
+    while True:
+        async with engine.begin() as conn:
+            row = (
+                await conn.execute(
+                    _COMMAND_USAGE_CHUNK, {"after_ts": after_ts, "after_id": after_id, "chunk_size": chunk_size}
+                )
+            ).first()
+        if row is None:  # no rows after the cursor
+            break
+        updated, after_ts, after_id = row
+        total += updated
+        logger.info("Converted %s rows of ts_command_usage (until %s).", total, after_ts)
+
+    # Refreshing the aggregates cannot be done in a transaction.
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("CALL refresh_continuous_aggregate('ts_command_usage_hourly', NULL, NULL)"))
+        await conn.execute(text("CALL refresh_continuous_aggregate('ts_command_usage_daily', NULL, NULL)"))
+    return total
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import enum
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import timedelta
+from time import monotonic
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(enum.StrEnum):
+    DROP_OLDEST = "drop_oldest"  # the oldest item is discarded to make room
+    BLOCK = "block"  # `put` waits until there is room
+
+
+class BatchWriter[T]:
+    """Buffer items in memory and write them in batches from a background task.
+
+    A batch is written every `flush_interval`, or as soon as `batch_size` items are waiting. When the queue is full,
+    `overflow` decides if the oldest items are dropped or if the producers wait.
+
+        ```py
+        writer = BatchWriter("usages", write_usages, max_size=10_000, batch_size=500)
+        writer.start()
+        await writer.put(row)
+        ...
+        await writer.close()  # writes the remaining items
+        ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write: Callable[[list[T]], Awaitable[None]],
+        max_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: timedelta = timedelta(seconds=5),
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            name: used in the logs.
+            write: a coroutine function that writes a batch. A batch that raises an exception is lost.
+            max_size: the maximum number of items waiting to be written. Defaults to 10 000.
+            batch_size: the maximum number of items per call to `write`. Defaults to 500.
+            flush_interval: the maximum time an item waits before being written. Defaults to 5 seconds.
+            overflow: what to do when the queue is full. Defaults to OverflowPolicy.DROP_OLDEST.
+        """
+        self.name = name
+        self._write = write
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval.total_seconds()
+        self._overflow = overflow
+
+        self._queue: deque[T] = deque()
+        self._batch_ready = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+        self.total_write_time = 0.0  # seconds
+        self.max_write_time = 0.0  # seconds
+        self._started_at = monotonic()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    async def put(self, item: T) -> None:
+        """Add an item to the queue. With OverflowPolicy.BLOCK, wait until there is room."""
+        while len(self._queue) >= self._max_size:
+            if self._overflow is OverflowPolicy.DROP_OLDEST:
+                self._queue.popleft()
+                self.dropped += 1
+            else:
+                self._not_full.clear()
+                await self._not_full.wait()
+
+        self._queue.append(item)
+        if len(self._queue) >= self._batch_size:
+            self._batch_ready.set()
+
+    def start(self) -> None:
+        """Start the background task. Must be called from a running event loop."""
+        self._closing = False
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background task and write the remaining items."""
+        self._closing = True
+        self._batch_ready.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write all the waiting items, in batches."""
+        async with self._flush_lock:
+            while self._queue:
+                batch = [self._queue.popleft() for _ in range(min(self._batch_size, len(self._queue)))]
+                if len(self._queue) < self._batch_size:
+                    self._batch_ready.clear()
+                self._not_full.set()
+                start = monotonic()
+                try:
+                    await self._write(batch)
+                except Exception as e:
+                    self.failed += len(batch)
+                    logger.exception("Failed to write a batch of %s items for %s.", len(batch), self.name, exc_info=e)
+                else:
+                    self.written += len(batch)
+                finally:
+                    elapsed = monotonic() - start
+                    self.batches += 1
+                    self.total_write_time += elapsed
+                    self.max_write_time = max(self.max_write_time, elapsed)
+
+    def stats(self) -> dict[str, Any]:
+        """Get the queue depth, the counters and the write latency (in seconds) of this writer."""
+        return {
+            "queued": len(self._queue),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "mean_write_time": self.total_write_time / self.batches if self.batches else 0.0,
+            "max_write_time": self.max_write_time,
+            "rows_per_second": self.written / (monotonic() - self._started_at),
+        }
+
+    async def _run(self) -> None:
+        while not self._closing:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._batch_ready.wait(), self._flush_interval)
+            await self.flush()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from dataclasses import asdict, dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import URL, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+    from .._config import Config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0  # seconds
+    max_wait: float = 0.0  # seconds
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """The default pool for async engines, that also measures the time spent waiting for a connection.
+
+    When every connection is checked out, a checkout waits until one is returned (or until `pool_timeout`).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = monotonic()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            wait = monotonic() - start
+            self.stats.checkouts += 1
+            self.stats.total_wait += wait
+            self.stats.max_wait = max(self.stats.max_wait, wait)
+
+    def recreate(self) -> TimedQueuePool:
+        pool = super().recreate()
+        pool.stats = self.stats  # pyright: ignore[reportAttributeAccessIssue]
+        return pool  # pyright: ignore[reportReturnType]
+
+
+def create_engine(config: Config) -> AsyncEngine:
+    """Create the database engine, using the `db_*` keys from the configuration.
+
+    The credentials are read from the environment variables (POSTGRES_USER, POSTGRES_PASSWORD and POSTGRES_DB).
+
+    Args:
+        config: the bot configuration.
+
+    Returns:
+        The engine. No connection is opened yet, see `warm_up`.
+    """
+    statement_cache_size = config.db_statement_cache_size if config.db_prepared_statements else 0
+    url = URL.create(
+        "postgresql+asyncpg",
+        username=os.environ["POSTGRES_USER"],
+        password=os.environ["POSTGRES_PASSWORD"],
+        host=config.db_host,
+        port=config.db_port,
+        database=os.environ["POSTGRES_DB"],
+        query={"prepared_statement_cache_size": str(statement_cache_size)},  # SQLAlchemy side
+    )
+    return create_async_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_recycle=config.db_pool_recycle,
+        pool_timeout=config.db_pool_timeout,
+        pool_pre_ping=config.db_pool_pre_ping,
+        connect_args={
+            "statement_cache_size": statement_cache_size,  # asyncpg side
+            "command_timeout": config.db_command_timeout,
+        },
+    )
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """Open `connections` connections concurrently, then return them to the pool, so the first queries don't have to
+    wait for the connection setup.
+    """
+
+    async def _connect() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(_connect() for _ in range(connections)))
+    except Exception as e:
+        logger.exception("Failed to warm up the database pool.", exc_info=e)
+
+
+def pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    """Get the state of the engine's pool, and the time spent waiting for a connection."""
+    pool = engine.pool
+    if not isinstance(pool, TimedQueuePool):
+        return {}
+    stats = asdict(pool.stats)
+    stats["mean_wait"] = pool.stats.total_wait / pool.stats.checkouts if pool.stats.checkouts else 0.0
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        **stats,
+    }
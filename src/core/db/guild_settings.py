@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Self
+
+from ..caches import TemporaryCache, async_cached
+from .tables import GuildDB, PremiumType
+from .upsert import get_or_create
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+@dataclass(frozen=True, slots=True)
+class GuildSettings:
+    """A read-only copy of a GuildDB row. New settings must be added here too."""
+
+    premium_type: PremiumType
+    translations_are_public: bool
+
+    @classmethod
+    def from_db(cls, guild_db: GuildDB) -> Self:
+        return cls(**{field.name: getattr(guild_db, field.name) for field in fields(cls)})
+
+
+class GuildSettingsCache:
+    """The guilds settings, kept in memory.
+
+    The settings are loaded when they are first needed, and every change must go through `update`, that writes to the
+    database then to the cache (write-through). The expiration only limits the memory usage.
+    """
+
+    def __init__(
+        self,
+        async_session: async_sessionmaker[AsyncSession],
+        expire: timedelta = timedelta(hours=6),
+        max_size: int = 50_000,
+    ) -> None:
+        self._async_session = async_session
+        self._cache: TemporaryCache[int, GuildSettings] = TemporaryCache(expire, max_size, name="guild_settings")
+        # Keyed by the guild id, like the entries written by `update`.
+        self._load = async_cached(self._cache, key=lambda guild_id: guild_id)(self._load_settings)
+
+    async def get(self, guild_id: int) -> GuildSettings:
+        """Get the settings of a guild. The row is created if it doesn't exist."""
+        return await self._load(guild_id)
+
+    async def update(self, guild_id: int, **values: Any) -> GuildSettings:
+        """Change some settings of a guild, in the database and in the cache.
+
+        Args:
+            guild_id: the guild id.
+            values: the new values, by column name, e.g. `translations_are_public=True`.
+
+        Returns:
+            The new settings.
+        """
+        async with self._async_session.begin() as session:
+            guild_db = await get_or_create(session, GuildDB, guild_id=guild_id)
+            for name, value in values.items():
+                setattr(guild_db, name, value)
+        settings = GuildSettings.from_db(guild_db)
+        self._load.invalidate(guild_id)  # a load running concurrently could return the old values
+        self._cache[guild_id] = settings
+        return settings
+
+    def drop(self, guild_id: int) -> None:
+        """Forget a guild, e.g. when the bot is removed from it."""
+        self._load.invalidate(guild_id)
+
+    async def _load_settings(self, guild_id: int) -> GuildSettings:
+        async with self._async_session.begin() as session:
+            return GuildSettings.from_db(await get_or_create(session, GuildDB, guild_id=guild_id))
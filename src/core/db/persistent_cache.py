@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+from collections.abc import Callable, Hashable, Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from ..caches import CacheStats, TemporaryCache
+from ..utils import chunker
+from .tables import CacheEntry
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@dataclass(slots=True)
+class PersistentCacheStats(CacheStats):
+    """The L1 counters, plus the lookups that missed the L1 and were found in the L2."""
+
+    l2_hits: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return (self.hits + self.l2_hits) / lookups if lookups else 0.0
+
+
+class PersistentCache[K: Hashable, V](TemporaryCache[K, V]):
+    """A TemporaryCache (L1) backed by the `cache_entry` table (L2), so the entries survive restarts.
+
+    Writes are buffered and sent in batches by a background task (write-behind), and expired rows are purged
+    periodically. The L2 is only read by `fetch`, when the key is missing from the L1. Setting a key to the object it
+    already holds does nothing, so a value read from the L2 can be set again without being written back.
+
+    The values must be serializable to JSON using `dump`, and restored using `load`.
+    Keys are stored using `str(key)`.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        expire: timedelta | int,
+        max_size: int | None = None,
+        max_bytes: int | None = None,
+        sizer: Callable[[V], int] = sys.getsizeof,
+        dump: Callable[[V], Any] = _identity,
+        load: Callable[[Any], V] = _identity,
+        flush_interval: timedelta = timedelta(seconds=10),
+        purge_interval: timedelta = timedelta(hours=1),
+        batch_size: int = 500,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            namespace: used to separate the caches in the database, and as the statistics name.
+            expire: the time after which the items expire, in both levels.
+            max_size: the maximum size of the L1 (in number of elements). Defaults to None.
+            max_bytes: the maximum memory used by the values in the L1, in bytes. Defaults to None.
+            sizer: a function that returns the size of a value, in bytes. Defaults to sys.getsizeof.
+            dump: a function that converts a value to a JSON-compatible object. Defaults to the identity.
+            load: a function that converts back a JSON-compatible object to a value. Defaults to the identity.
+            flush_interval: the time between two writes to the database. Defaults to 10 seconds.
+            purge_interval: the time between two deletions of the expired rows. Defaults to 1 hour.
+            batch_size: the maximum number of rows per INSERT. Defaults to 500.
+        """
+        super().__init__(expire, max_size, name=namespace, max_bytes=max_bytes, sizer=sizer)
+        self.namespace = namespace
+        self._dump = dump
+        self._load = load
+        self._flush_interval = flush_interval.total_seconds()
+        self._purge_interval = purge_interval.total_seconds()
+        self._batch_size = batch_size
+
+        self._pending: dict[K, tuple[V, datetime]] = {}
+        self._deleted: set[K] = set()
+        self._async_session: async_sessionmaker[AsyncSession] | None = None
+        self._writer: asyncio.Task[None] | None = None
+        self._closing = asyncio.Event()
+        if self.stats is not None:
+            self.stats = PersistentCacheStats()
+
+    def _set(self, key: K, value: V) -> None:
+        # Setting the object already cached is a no-op, e.g. when async_cached stores the result of a `fetch`: it came
+        # from the L2, and writing it back would extend its expiration.
+        cached = self._cache.get(key)
+        if cached is not None and cached.value is value and cached.deadline >= monotonic():
+            return
+        super()._set(key, value)
+        self._pending[key] = (value, datetime.now(UTC) + timedelta(seconds=self._expire))
+        self._deleted.discard(key)
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        self._pending.pop(key, None)
+        self._deleted.add(key)
+        return super().pop(key, default)
+
+    def start(self, async_session: async_sessionmaker[AsyncSession]) -> None:
+        """Bind the database and start the background writer. Must be called from a running event loop."""
+        self._async_session = async_session
+        self._closing.clear()
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.get_running_loop().create_task(self._write_behind())
+
+    async def close(self) -> None:
+        """Stop the background writer and flush the pending writes."""
+        self.stop_sweeper()
+        self._closing.set()
+        if self._writer is not None:
+            # Not cancelled: a flush in progress has already taken the pending items, they would be lost.
+            await self._writer
+            self._writer = None
+        await self.flush()
+
+    async def fetch(self, key: K) -> V | None:
+        """Get an item from the L1, or load it from the L2 if it is missing.
+
+        The item is then kept in the L1 for a full expiration delay, even if the row expires sooner. The L1 lookup is
+        not counted in the stats: `fetch` is called after a lookup that missed (e.g. by async_cached), which counted it.
+
+        Returns:
+            The value, or None if it is in neither level.
+        """
+        cached = self._cache.get(key)
+        if cached is not None and cached.deadline >= monotonic():
+            return cached.value
+        if self._async_session is None or key in self._deleted:
+            return None
+
+        async with self._async_session() as session:
+            stored = await session.scalar(
+                select(CacheEntry.value).where(
+                    CacheEntry.namespace == self.namespace,
+                    CacheEntry.key == str(key),
+                    CacheEntry.expires_at > func.now(),
+                )
+            )
+        if stored is None:
+            return None
+        value = self._load(stored)
+        super()._set(key, value)  # already in the L2, do not write it back
+        self._count_l2_hit()
+        return value
+
+    async def fetch_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Get several items, like `fetch`, but the items missing from the L1 are loaded with a single query.
+        Unlike `fetch`, the L1 lookups are counted in the stats, since the callers look the keys up only here.
+
+        Returns:
+            The found items. Missing keys are not included.
+        """
+        found: dict[K, V] = {}
+        missing: dict[str, K] = {}
+        for key in keys:
+            if (value := self.get(key)) is not None:
+                found[key] = value
+            elif key not in self._deleted:
+                missing[str(key)] = key
+        if self._async_session is None or not missing:
+            return found
+
+        async with self._async_session() as session:
+            rows = await session.execute(
+                select(CacheEntry.key, CacheEntry.value).where(
+                    CacheEntry.namespace == self.namespace,
+                    CacheEntry.key.in_(missing),
+                    CacheEntry.expires_at > func.now(),
+                )
+            )
+            for str_key, stored in rows.tuples():
+                key = missing[str_key]
+                found[key] = value = self._load(stored)
+                super()._set(key, value)  # already in the L2, do not write it back
+                self._count_l2_hit()
+        return found
+
+    def _count_l2_hit(self) -> None:
+        if isinstance(self.stats, PersistentCacheStats):
+            self.stats.l2_hits += 1
+
+    async def flush(self) -> None:
+        """Write the pending items and deletions to the L2, in batches."""
+        if self._async_session is None or not (self._pending or self._deleted):
+            return
+        pending, self._pending = self._pending, {}
+        deleted, self._deleted = self._deleted, set()
+
+        rows = [
+            {"namespace": self.namespace, "key": str(key), "value": self._dump(value), "expires_at": expires_at}
+            for key, (value, expires_at) in pending.items()
+        ]
+        async with self._async_session.begin() as session:
+            for batch in chunker(rows, self._batch_size):
+                stmt = insert(CacheEntry).values(batch)
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[CacheEntry.namespace, CacheEntry.key],
+                        set_={"value": stmt.excluded.value, "expires_at": stmt.excluded.expires_at},
+                    )
+                )
+            for batch in chunker([str(key) for key in deleted], self._batch_size):
+                await session.execute(
+                    delete(CacheEntry).where(CacheEntry.namespace == self.namespace, CacheEntry.key.in_(batch))
+                )
+
+    async def purge(self) -> None:
+        """Delete the expired rows of this namespace from the L2."""
+        if self._async_session is None:
+            return
+        async with self._async_session.begin() as session:
+            await session.execute(
+                delete(CacheEntry).where(CacheEntry.namespace == self.namespace, CacheEntry.expires_at <= func.now())
+            )
+
+    async def _write_behind(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_purge = loop.time()
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._closing.wait(), self._flush_interval)
+            if self._closing.is_set():
+                return  # the last flush is done by close
+            try:
+                await self.flush()
+                if loop.time() >= next_purge:
+                    await self.purge()
+                    next_purge = loop.time() + self._purge_interval
+            except Exception as e:
+                logger.exception("Failed to write the persistent cache %s.", self.namespace, exc_info=e)
@@ -6,7 +6,7 @@ from datetime import datetime
 from functools import partial
 from typing import Annotated, Any, ClassVar, TypeVar
 
-from sqlalchemy import ARRAY, BigInteger, DateTime, Enum, ForeignKey
+from sqlalchemy import ARRAY, BigInteger, DateTime, Enum, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import BIGINT, BOOLEAN, INTEGER, JSONB, SMALLINT, VARCHAR
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.ext.mutable import Mutable
@@ -84,7 +84,7 @@ class Poll(Base, kw_only=True):
     __tablename__ = "poll"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    message_id: Mapped[Snowflake] = mapped_column()
+    message_id: Mapped[Snowflake] = mapped_column(index=True, unique=True)
     channel_id: Mapped[Snowflake] = mapped_column()
     guild_id: Mapped[Snowflake] = mapped_column(ForeignKey(GuildDB.guild_id))
     author_id: Mapped[Snowflake] = mapped_column()
@@ -109,7 +109,7 @@ class PollChoice(Base):
     __tablename__ = "poll_choice"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    poll_id: Mapped[int] = mapped_column(ForeignKey(Poll.id))
+    poll_id: Mapped[int] = mapped_column(ForeignKey(Poll.id), index=True)  # loaded with the poll
     label: Mapped[str] = mapped_column(VARCHAR)  # todo: define max length
 
     def __hash__(self):
@@ -125,6 +125,10 @@ class PollAnswer(Base):
     """
 
     __tablename__ = "poll_answer"
+    __table_args__ = (
+        Index("ix_poll_answer_poll_id_user_id", "poll_id", "user_id"),  # the votes of a user
+        Index("ix_poll_answer_poll_id_value", "poll_id", "value"),  # the results, without reading the table
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     poll_id: Mapped[int] = mapped_column(ForeignKey(Poll.id))
@@ -133,6 +137,17 @@ class PollAnswer(Base):
     anonymous: Mapped[bool] = mapped_column(default=False)
 
 
+class CacheEntry(Base):
+    """Second level of the persistent caches (see core.db.persistent_cache)."""
+
+    __tablename__ = "cache_entry"
+
+    namespace: Mapped[str] = mapped_column(VARCHAR, primary_key=True)
+    key: Mapped[str] = mapped_column(VARCHAR, primary_key=True)
+    value: Mapped[Any] = mapped_column(JSONB, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+
 class TSGuildCount(Base):
     __tablename__ = "ts_guild_count"
 
@@ -142,11 +157,23 @@ class TSGuildCount(Base):
 
 class TSUsage(Base):
     __tablename__ = "ts_command_usage"
+    __table_args__ = (
+        Index("ix_ts_command_usage_command_ts", "command", "ts"),
+        Index("ix_ts_command_usage_command_type_ts", "command_type", "ts"),
+        Index("ix_ts_command_usage_locale_ts", "locale", "ts"),
+    )
 
     ts: Mapped[TimestampFK] = mapped_column()
+    id: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("nextval('ts_command_usage_id_seq')"), primary_key=True
+    )  # ts is not unique
     user_id: Mapped[Snowflake] = mapped_column()  # ForeignKey(UserDB.user_id))
     guild_id: Mapped[Snowflake | None] = mapped_column(ForeignKey(GuildDB.guild_id))
-    data: Mapped[dict[str, Any]] = _mapped_column(JSONB, default_factory=dict)
+    command: Mapped[str | None] = mapped_column(VARCHAR)  # the root command name
+    exact_command: Mapped[str | None] = mapped_column(VARCHAR)  # the qualified name (with the groups)
+    command_type: Mapped[int | None] = mapped_column(SMALLINT)  # discord.AppCommandType value
+    locale: Mapped[str | None] = mapped_column(VARCHAR)  # discord.Locale name
+    data: Mapped[dict[str, Any]] = _mapped_column(JSONB, default_factory=dict)  # the command namespace
 
 
 class TSPollModification(Base):
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import MISSING
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import JSON, DateTime, inspect
+from sqlalchemy.sql.schema import CallableColumnDefault, ScalarElementColumnDefault
+
+from .batch_writer import BatchWriter, OverflowPolicy
+
+if TYPE_CHECKING:
+    from sqlalchemy import Column, Table
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from .tables import Base
+
+logger = logging.getLogger(__name__)
+
+type Record = tuple[Any, ...]
+type BeforeWrite = Callable[[AsyncSession, type[Base], tuple[str, ...], list[Record]], Awaitable[None]]
+
+
+class _TableLayout:
+    """The columns of a table, in the order of the records, and how to convert the values for COPY."""
+
+    def __init__(self, table: type[Base]) -> None:
+        # the columns generated by the database (e.g. ids) are left out, except `ts` that is set by `record`
+        local_table = cast("Table", inspect(table).local_table)  # always a Table for the declarative classes
+        columns: list[Column[Any]] = [
+            column for column in local_table.columns if column.server_default is None or column.name == "ts"
+        ]
+        self.table_name = local_table.name
+        self.columns = tuple(column.name for column in columns)
+        # asyncpg expects JSON values already serialized (SQLAlchemy does it for the ORM queries)
+        self.json_columns = tuple(i for i, column in enumerate(columns) if isinstance(column.type, JSON))
+        # asyncpg refuses aware datetimes for `timestamp without time zone` columns
+        self.naive_ts = "ts" in self.columns and not cast(DateTime, local_table.c.ts.type).timezone
+        self.defaults: dict[str, Any] = {}
+        self.default_factories: dict[str, Callable[[], Any]] = {}
+        # `default_factory` (e.g. the `data` dicts) is only known by the dataclass, SQLAlchemy doesn't see it
+        dataclass_factories = {field.name: field.default_factory for field in dataclasses.fields(table)}
+        for column in columns:
+            if isinstance(column.default, ScalarElementColumnDefault):
+                self.defaults[column.name] = column.default.arg
+            elif isinstance(column.default, CallableColumnDefault):
+                # SQLAlchemy wraps the callables so they take the execution context, there is none here (the wrapper
+                # ignores it if the callable takes no argument)
+                self.default_factories[column.name] = partial(column.default.arg, None)  # pyright: ignore[reportArgumentType]
+            elif (factory := dataclass_factories.get(column.key, MISSING)) is not MISSING:
+                self.default_factories[column.name] = factory
+
+    def record(self, fields: dict[str, Any]) -> Record:
+        if "ts" in self.columns and "ts" not in fields:
+            now = datetime.now(UTC)  # when the event happened, not when it is written
+            fields["ts"] = now.replace(tzinfo=None) if self.naive_ts else now
+        if unknown := fields.keys() - self.columns:
+            raise TypeError(f"Unknown columns for {self.table_name}: {', '.join(unknown)}")
+        for name, factory in self.default_factories.items():
+            if name not in fields:
+                fields[name] = factory()
+        values = [fields[name] if name in fields else self.defaults.get(name) for name in self.columns]
+        for i in self.json_columns:
+            values[i] = json.dumps(values[i])
+        return tuple(values)
+
+
+class TimeSeriesWriter:
+    """Write rows to the time series tables (TS*) in batches, using COPY.
+
+    The rows of each table are buffered in their own BatchWriter (see its documentation for the batching and the
+    overflow policy). Rows are tuples in the order of the table columns, so a batch is sent to `COPY` as is.
+
+        ```py
+        await bot.timeseries.emit(db.TSGuildCount, value=len(bot.guilds))
+        ```
+    """
+
+    def __init__(
+        self,
+        async_session: async_sessionmaker[AsyncSession],
+        max_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: timedelta = timedelta(seconds=5),
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        before_write: BeforeWrite | None = None,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            async_session: the sessions factory.
+            max_size: the maximum number of rows waiting to be written, per table. Defaults to 10 000.
+            batch_size: the maximum number of rows per COPY. Defaults to 500.
+            flush_interval: the maximum time a row waits before being written. Defaults to 5 seconds.
+            overflow: what to do when the queue of a table is full. Defaults to OverflowPolicy.DROP_OLDEST.
+            before_write: a coroutine function called in the transaction, before the COPY, e.g. to create the rows
+                referenced by the batch. Defaults to None.
+        """
+        self._async_session = async_session
+        self._writer_options: dict[str, Any] = {
+            "max_size": max_size,
+            "batch_size": batch_size,
+            "flush_interval": flush_interval,
+            "overflow": overflow,
+        }
+        self._before_write = before_write
+        self._layouts: dict[type[Base], _TableLayout] = {}
+        self._writers: dict[type[Base], BatchWriter[Record]] = {}
+        self._started = False
+
+    async def emit(self, table: type[Base], /, **fields: Any) -> None:
+        """Add a row to the queue of a table.
+
+        The missing columns use their default values, and `ts` is set to the current time.
+
+        Raises:
+            TypeError: a field is not a column of the table.
+        """
+        if (writer := self._writers.get(table)) is None:
+            writer = self._add_table(table)
+        await writer.put(self._layouts[table].record(fields))
+
+    def start(self) -> None:
+        """Start the background tasks. Must be called from a running event loop."""
+        self._started = True
+        for writer in self._writers.values():
+            writer.start()
+
+    async def close(self) -> None:
+        """Stop the background tasks and write the remaining rows."""
+        self._started = False
+        for writer in self._writers.values():
+            await writer.close()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get the statistics of each table writer (see BatchWriter.stats)."""
+        return {writer.name: writer.stats() for writer in self._writers.values()}
+
+    def _add_table(self, table: type[Base]) -> BatchWriter[Record]:
+        layout = self._layouts[table] = _TableLayout(table)
+        writer = self._writers[table] = BatchWriter(
+            layout.table_name, partial(self._copy, table), **self._writer_options
+        )
+        if self._started:
+            writer.start()
+        return writer
+
+    async def _copy(self, table: type[Base], records: list[Record]) -> None:
+        layout = self._layouts[table]
+        async with self._async_session.begin() as session:
+            if self._before_write is not None:
+                await self._before_write(session, table, layout.columns, records)
+            connection = await (await session.connection()).get_raw_connection()
+            await connection.driver_connection.copy_records_to_table(  # pyright: ignore[reportOptionalMemberAccess]
+                layout.table_name, records=records, columns=layout.columns
+            )
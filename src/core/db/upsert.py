@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import inspect, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from .tables import Base
+
+
+async def get_or_create[T: Base](session: AsyncSession, table: type[T], **key: Any) -> T:
+    """Get a row, or insert it if it doesn't exist, in a single round-trip.
+
+    The query is `WITH ins AS (INSERT ... ON CONFLICT DO NOTHING RETURNING *) SELECT * FROM ins UNION ALL SELECT ...`.
+    Both parts use the same snapshot, so exactly one of them returns the row, except if the row is inserted by a
+    concurrent transaction in the meantime. It is then read by a second query.
+
+    Args:
+        session: the session to use.
+        table: the mapped class.
+        key: the primary key columns values. The other columns use their default values if the row is created.
+
+    Returns:
+        The row, attached to the session.
+    """
+    local_table = inspect(table).local_table
+    inserted = insert(table).values(**key).on_conflict_do_nothing().returning(*local_table.c).cte("inserted")
+    existing = select(local_table).where(*(local_table.c[name] == value for name, value in key.items()))
+    stmt = select(table).from_statement(union_all(select(inserted), existing))
+
+    instance = (await session.scalars(stmt)).first()
+    if instance is None:  # concurrent insert, not visible in the snapshot of the previous query
+        instance = await session.get_one(table, tuple(key.values()))
+    return instance
+
+
+async def create_if_missing(session: AsyncSession, table: type[Base], **key: Any) -> None:
+    """Insert a row if it doesn't exist (`INSERT ... ON CONFLICT DO NOTHING`), without loading it.
+
+    Args:
+        session: the session to use.
+        table: the mapped class.
+        key: the primary key columns values. The other columns use their default values if the row is created.
+    """
+    await session.execute(insert(table).values(**key).on_conflict_do_nothing())
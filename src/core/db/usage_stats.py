@@ -0,0 +1,131 @@
+"""Read the commands usage from the continuous aggregates (see the migration 9ec29c13bc4d).
+
+The aggregates are views maintained by TimescaleDB, they are not mapped in `tables.py` to be ignored by Alembic.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import BigInteger, ColumnElement, DateTime, String, column, func, select, table
+
+if TYPE_CHECKING:
+    from sqlalchemy import TableClause
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _aggregate(name: str) -> TableClause:
+    return table(
+        name,
+        column("bucket", DateTime),
+        column("command", String),
+        column("locale", String),
+        column("guild_id", BigInteger),
+        column("uses", BigInteger),
+    )
+
+
+usage_hourly = _aggregate("ts_command_usage_hourly")
+usage_daily = _aggregate("ts_command_usage_daily")
+
+
+def _source(period: timedelta) -> TableClause:
+    # the daily buckets are enough for long periods, and are a lot less rows to read
+    return usage_daily if period >= timedelta(days=2) else usage_hourly
+
+
+async def _usage_by(
+    session: AsyncSession, key: str, period: timedelta, guild_id: int | None, limit: int | None
+) -> list[tuple[str, int]]:
+    source = _source(period)
+    since = datetime.now(UTC).replace(tzinfo=None) - period  # the ts columns are naive UTC timestamps
+    conditions: list[ColumnElement[bool]] = [source.c.bucket >= since]
+    if guild_id is not None:
+        conditions.append(source.c.guild_id == guild_id)
+
+    total = func.sum(source.c.uses).label("uses")
+    stmt = select(source.c[key], total).where(*conditions).group_by(source.c[key]).order_by(total.desc()).limit(limit)
+    result = await session.execute(stmt)
+    return [(name, int(uses)) for name, uses in result.tuples()]
+
+
+async def usage_by_command(
+    session: AsyncSession, period: timedelta, guild_id: int | None = None, limit: int | None = 10
+) -> list[tuple[str, int]]:
+    """Get the most used commands.
+
+    Args:
+        session: the session to use.
+        period: the time range, until now.
+        guild_id: only count the usage in this guild. Defaults to None (everywhere).
+        limit: the maximum number of commands. Defaults to 10.
+
+    Returns:
+        (command name, uses) pairs, the most used first.
+    """
+    return await _usage_by(session, "command", period, guild_id, limit)
+
+
+async def usage_by_locale(
+    session: AsyncSession, period: timedelta, guild_id: int | None = None, limit: int | None = 10
+) -> list[tuple[str, int]]:
+    """Get the locales of the users, by number of commands used. See `usage_by_command` for the arguments."""
+    return await _usage_by(session, "locale", period, guild_id, limit)
+
+
+async def usage_by_guild(session: AsyncSession, period: timedelta, limit: int | None = 10) -> list[tuple[int, int]]:
+    """Get the guilds where the most commands are used (the private channels are excluded).
+
+    Args:
+        session: the session to use.
+        period: the time range, until now.
+        limit: the maximum number of guilds. Defaults to 10.
+
+    Returns:
+        (guild id, uses) pairs, the most active first.
+    """
+    source = _source(period)
+    since = datetime.now(UTC).replace(tzinfo=None) - period
+    total = func.sum(source.c.uses).label("uses")
+    stmt = (
+        select(source.c.guild_id, total)
+        .where(source.c.bucket >= since, source.c.guild_id.is_not(None))
+        .group_by(source.c.guild_id)
+        .order_by(total.desc())
+        .limit(limit)
+    )
+    result = await session.execute(stmt)
+    return [(guild_id, int(uses)) for guild_id, uses in result.tuples()]
+
+
+async def usage_over_time(
+    session: AsyncSession, period: timedelta, command: str | None = None, guild_id: int | None = None
+) -> list[tuple[datetime, int]]:
+    """Get the number of commands used per bucket (hour or day, depending on the period).
+
+    Args:
+        session: the session to use.
+        period: the time range, until now.
+        command: only count this command. Defaults to None (all commands).
+        guild_id: only count the usage in this guild. Defaults to None (everywhere).
+
+    Returns:
+        (bucket start, uses) pairs, in chronological order.
+    """
+    source = _source(period)
+    since = datetime.now(UTC).replace(tzinfo=None) - period
+    conditions: list[ColumnElement[bool]] = [source.c.bucket >= since]
+    if command is not None:
+        conditions.append(source.c.command == command)
+    if guild_id is not None:
+        conditions.append(source.c.guild_id == guild_id)
+
+    stmt = (
+        select(source.c.bucket, func.sum(source.c.uses))
+        .where(*conditions)
+        .group_by(source.c.bucket)
+        .order_by(source.c.bucket)
+    )
+    result = await session.execute(stmt)
+    return [(bucket, int(uses)) for bucket, uses in result.tuples()]
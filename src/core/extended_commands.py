@@ -21,6 +21,7 @@ from discord.ext import commands
 from discord.utils import maybe_coroutine
 
 from .errors import MiscCheckFailure, MiscCommandError, MiscNoPrivateMessage, UnexpectedError
+from .i18n import LOCALE_DEFAULT, current_locale
 
 if TYPE_CHECKING:
     from discord.abc import MessageableChannel, Snowflake
@@ -126,6 +127,8 @@ class MiscCommand[CogT: ExtendedCog, R]:
             )
             if not trigger_condition:
                 return None  # type: ignore
+        # Misc commands have no interaction to get the user locale from. Listeners are executed in their own task.
+        current_locale.set(LOCALE_DEFAULT)
         resolved_context = await MiscCommandContext[Any].resolve(self.bot, context, self)
         try:
             for checker in self.checks:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import gettext
-import inspect
 import logging
+import sys
+from contextvars import ContextVar
+from functools import lru_cache
 from glob import glob
 from os import path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from discord import Interaction, Locale, app_commands
 from discord.utils import MISSING, find
@@ -13,7 +15,7 @@ from discord.utils import MISSING, find
 from core.constants import TranslationContextLimits
 
 if TYPE_CHECKING:
-    from discord.app_commands import TranslationContextTypes, locale_str
+    from discord.app_commands import TranslationContextLocation, TranslationContextTypes, locale_str
 
 BASE_DIR = "."
 LOCALE_DIR = "locale"
@@ -22,10 +24,16 @@ LOCALE_DEFAULT = Locale.british_english
 logger = logging.getLogger(__name__)
 
 translations: dict[Locale, gettext.GNUTranslations | gettext.NullTranslations] = {}
+# Flat copies of the catalogs, {locale: {msgid: msgstr}}. A missing msgid is not translated.
+catalogs: dict[Locale, dict[str, str]] = {}
+
+# Set once per interaction / misc command dispatch (see CustomCommandTree and MiscCommand), so i18n doesn't have to
+# look for the interaction in the stack. Tasks copy the context, so the value doesn't leak between dispatches.
+current_locale: ContextVar[Locale] = ContextVar("current_locale")
 
 
 def load_translations():
-    global translations
+    global translations, catalogs
 
     _locales = frozenset(map(path.basename, filter(path.isdir, glob(path.join(BASE_DIR, LOCALE_DIR, "*")))))
 
@@ -36,10 +44,56 @@ def load_translations():
 
     translations[LOCALE_DEFAULT] = gettext.NullTranslations()
 
+    # Warm-up: every catalog is flattened once, so a lookup is a dict probe, even for rarely used locales.
+    catalogs = {}
+    for locale, translation in translations.items():
+        if isinstance(translation, gettext.GNUTranslations):
+            # `_catalog` is not public, but it is the parsed .mo file, and the only way to list the messages.
+            catalog = cast(
+                dict[str | tuple[str, int], str],
+                translation._catalog,  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+            )
+            # skip plural forms (tuple keys) and the header (empty msgid)
+            catalogs[locale] = {msgid: msgstr for msgid, msgstr in catalog.items() if isinstance(msgid, str) and msgid}
+    _translate_constant.cache_clear()
+
+
+def _translate(string: str, locale: Locale) -> str:
+    catalog = catalogs.get(locale)
+    return string if catalog is None else catalog.get(string, string)
+
+
+@lru_cache(maxsize=4096)
+def _translate_constant(string: str, locale: Locale) -> str:
+    """Translate a string used without formatting arguments. Most strings are constants (labels, titles...), so the
+    result is memoized (the `.format()` is still needed to unescape the braces).
+    """
+    return _translate(string, locale).format()
+
 
 class Translator(app_commands.Translator):
+    """Translate the commands names, descriptions... for Discord.
+
+    discord.py calls `translate` for every string of every command, in every locale, each time the payloads are built
+    (sync, fetch...). The results are kept in a table, so only the first build does the work.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._table: dict[tuple[str, Locale, TranslationContextLocation], str] = {}
+
+    async def unload(self) -> None:
+        self._table.clear()
+
     async def translate(self, string: locale_str, locale: Locale, context: TranslationContextTypes) -> str:
-        new_string = i18n(str(string), _locale=locale)
+        key = (str(string), locale, context.location)
+        if (new_string := self._table.get(key)) is None:
+            new_string = self._table[key] = self._translate(key[0], locale, context)
+        return new_string
+
+    @staticmethod
+    def _translate(string: str, locale: Locale, context: TranslationContextTypes) -> str:
+        new_string = i18n(string, _locale=locale)
         char_limit = TranslationContextLimits.from_location(context.location)
         if char_limit and len(new_string) > char_limit.value:
             logger.warning(
@@ -135,29 +189,33 @@ def i18n(
         return string
 
     if _locale is MISSING:
-        stack = inspect.stack()
-
+        _locale = current_locale.get(MISSING)
+    if _locale is MISSING:
+        # Fallback when the locale is not set in the context (e.g. views callbacks): look for an interaction in the
+        # stack. The frames are walked directly, inspect.stack() would also read the source files.
         inter: Interaction | None = None
-        for frame_info in stack:
-            inter = find((lambda _item: isinstance(_item, Interaction)), frame_info.frame.f_locals.values())
-            if inter is not None:
-                break
+        frame = sys._getframe(1)  # pyright: ignore[reportPrivateUsage]
+        while frame is not None and inter is None:
+            inter = find((lambda _item: isinstance(_item, Interaction)), frame.f_locals.values())
+            frame = frame.f_back
 
         if inter is None:
             if not _silent:
-                caller = inspect.getframeinfo(inspect.stack()[1][0])
+                caller = sys._getframe(1)  # pyright: ignore[reportPrivateUsage]
                 logger.warning(
                     'i18n function cannot retrieve an interaction for the string "%s" at line %s in file %s',
                     string,
-                    caller.lineno,
-                    caller.filename,
+                    caller.f_lineno,
+                    caller.f_code.co_filename,
                 )
             return string
         _locale = inter.locale
     if _locale is None:
         result = string.format(*args, **kwargs)
+    elif not args and not kwargs:
+        result = _translate_constant(string, _locale)
     else:
-        result = translations.get(_locale, translations[LOCALE_DEFAULT]).gettext(string).format(*args, **kwargs)
+        result = _translate(string, _locale).format(*args, **kwargs)
 
     if _l > 0 and len(result) > _l:
         logger.warning("The translated and formatted string is too long: %s\n%s", string, result)
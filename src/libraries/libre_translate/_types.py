@@ -24,7 +24,11 @@ class Translation(TypedDict):
     translatedText: str
 
 
+class BatchTranslation(TypedDict):
+    translatedText: list[str]
+
+
 class TranslatePayload(TypedDict):
-    q: str
+    q: str | list[str]
     source: str
     target: str
@@ -1,9 +1,12 @@
+import asyncio
+from collections.abc import Iterator, Sequence
+from contextlib import nullcontext
 from typing import Literal, Never
 from urllib.parse import urljoin
 
 import aiohttp
 
-from ._types import TranslatePayload, Translation
+from ._types import BatchTranslation, TranslatePayload, Translation
 from .languages import Language
 
 
@@ -48,5 +51,58 @@ class LibreTranslate:
             raw: Translation = await response.json()
         return raw["translatedText"]
 
+    async def batch_translate(
+        self,
+        texts: Sequence[str],
+        to: Language,
+        from_: Language | Literal["auto"] = "auto",
+        max_chars: int = 5000,
+        max_texts: int = 100,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[str]:
+        """Translate many texts, with as few requests as possible (the API accepts a list of texts).
+
+        The texts are packed in requests of at most `max_chars` characters and `max_texts` texts (a longer text is sent
+        alone), sent concurrently.
+
+        Args:
+            texts (Sequence[str]): the texts to translate.
+            to (Language): the language to translate into.
+            from_ (Language | Literal["auto"], optional): the language to translate from. Defaults to "auto".
+            max_chars (int, optional): the maximum number of characters per request. Defaults to 5000.
+            max_texts (int, optional): the maximum number of texts per request. Defaults to 100.
+            semaphore (asyncio.Semaphore | None, optional): acquired for each request, to limit the number of
+                concurrent requests to the host. Defaults to None (no limit).
+
+        Returns:
+            list[str]: the translated strings, in the same order as `texts`.
+        """
+        source = "auto" if from_ == "auto" else from_.value
+
+        async def request(batch: list[str]) -> list[str]:
+            payload = TranslatePayload(q=batch, source=source, target=to.value)
+            async with (
+                semaphore or nullcontext(),
+                self.client.post(urljoin(self.host_url, "/translate"), json=payload) as response,
+            ):
+                raw: BatchTranslation = await response.json()
+            return raw["translatedText"]
+
+        results = await asyncio.gather(*(request(batch) for batch in self._pack(texts, max_chars, max_texts)))
+        return [translation for batch in results for translation in batch]
+
+    @staticmethod
+    def _pack(texts: Sequence[str], max_chars: int, max_texts: int) -> Iterator[list[str]]:
+        batch: list[str] = []
+        size = 0
+        for text in texts:
+            if batch and (size + len(text) > max_chars or len(batch) == max_texts):
+                yield batch
+                batch, size = [], 0
+            batch.append(text)
+            size += len(text)
+        if batch:
+            yield batch
+
     async def detect(self) -> Never:
         raise NotImplementedError
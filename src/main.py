@@ -68,5 +68,33 @@ def export_features(
     asyncio.run(features_exporter(filename=filename))
 
 
+@cli.command()
+def backfill_command_usage(
+    config_path: Annotated[
+        Path,
+        typer.Option("--config", "-c", help="Bind a configuration file."),
+    ] = Path("./config.toml"),
+    chunk_size: Annotated[
+        int,
+        typer.Option("--chunk-size", help="Number of rows converted per transaction."),
+    ] = 10_000,
+):
+    """Convert the commands usage rows written before the typed columns were added."""
+    define_config(config_path)
+
+    from core.db.backfill import backfill_command_usage
+    from core.db.engine import create_engine
+
+    async def _backfill():
+        engine = create_engine(config)
+        try:
+            total = await backfill_command_usage(engine, chunk_size)
+        finally:
+            await engine.dispose()
+        logger.info("%s rows converted.", total)
+
+    asyncio.run(_backfill())
+
+
 if __name__ == "__main__":
     cli()
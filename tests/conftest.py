@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+
+class FakeSessionMaker:
+    """Stands for the async_sessionmaker and its sessions: every `scalar` query finds `stored`.
+
+    Code that goes through `get_or_create` & co. patches them, the session is not used.
+    """
+
+    def __init__(self) -> None:
+        self.stored: Any = None
+
+    @asynccontextmanager
+    async def __call__(self):
+        yield self
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self
+
+    async def scalar(self, statement: Any) -> Any:
+        return self.stored
+
+
+@pytest.fixture
+def session_maker() -> FakeSessionMaker:
+    return FakeSessionMaker()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from core.db import guild_settings
+from core.db.guild_settings import GuildSettingsCache
+from core.db.tables import PremiumType
+
+
+@pytest.fixture
+def rows(monkeypatch: pytest.MonkeyPatch) -> dict[int, SimpleNamespace]:
+    rows: dict[int, SimpleNamespace] = {}
+
+    async def get_or_create(session: Any, table: Any, guild_id: int) -> SimpleNamespace:
+        return rows.setdefault(guild_id, SimpleNamespace(premium_type=PremiumType.NONE, translations_are_public=False))
+
+    monkeypatch.setattr(guild_settings, "get_or_create", get_or_create)
+    return rows
+
+
+def test_update_is_read_from_the_cache(session_maker: Any, rows: dict[int, SimpleNamespace]):
+    async def scenario():
+        settings = GuildSettingsCache(session_maker)
+        assert (await settings.get(1)).translations_are_public is False
+
+        await settings.update(1, translations_are_public=True)
+        rows[1].translations_are_public = False  # the database must not be read again
+
+        assert (await settings.get(1)).translations_are_public is True
+
+    asyncio.run(scenario())
+
+
+def test_drop_reloads_from_the_database(session_maker: Any, rows: dict[int, SimpleNamespace]):
+    async def scenario():
+        settings = GuildSettingsCache(session_maker)
+        await settings.update(1, translations_are_public=True)
+        rows[1].translations_are_public = False
+
+        settings.drop(1)
+        assert (await settings.get(1)).translations_are_public is False
+
+    asyncio.run(scenario())
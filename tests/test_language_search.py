@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from cogs.translate.languages import LanguagesEnum
+from cogs.translate.search import LanguageSearch
+from core import i18n
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def french_catalog(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Compile the French .po like the Dockerfile does, and load it."""
+    messages = tmp_path / "locale" / "fr" / "LC_MESSAGES"
+    messages.mkdir(parents=True)
+    spec = importlib.util.spec_from_file_location("msgfmt", ROOT / "bin" / "msgfmt.py")
+    assert spec is not None and spec.loader is not None
+    msgfmt = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(msgfmt)
+    msgfmt.make(str(ROOT / "resources" / "locale" / "fr" / "LC_MESSAGES" / "mybot.po"), str(messages / "mybot.mo"))
+    monkeypatch.setattr(i18n, "BASE_DIR", str(tmp_path))
+    i18n.load_translations()
+    yield
+    monkeypatch.undo()
+    i18n.load_translations()
+
+
+def test_localized_name_is_found(french_catalog: None):
+    search = LanguageSearch(language.value for language in LanguagesEnum)
+
+    assert [choice.name for choice in search.search("franç")] == ["french"]
+    assert search.search("allem")[0].name == "german"
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from libraries.libre_translate import Language, LibreTranslate
+
+
+class StubServer:
+    """Stands for the /translate endpoint: "translates" by upper-casing, and records the requests."""
+
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.requests: list[list[str]] = []
+        self.running = 0
+        self.peak = 0
+
+    async def translate(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.requests.append(payload["q"])
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(self.delay)  # let the other requests start
+        self.running -= 1
+        return web.json_response({"translatedText": [text.upper() for text in payload["q"]]})
+
+    async def batch_translate(
+        self,
+        texts: Sequence[str],
+        max_chars: int = 5000,
+        max_texts: int = 100,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[str]:
+        app = web.Application()
+        app.router.add_post("/translate", self.translate)
+        async with TestServer(app) as server:
+            client = LibreTranslate(str(server.make_url("/")))
+            try:
+                return await client.batch_translate(
+                    texts, Language.FRENCH, max_chars=max_chars, max_texts=max_texts, semaphore=semaphore
+                )
+            finally:
+                await client.close()
+
+
+def test_order_is_kept_across_requests():
+    texts = [f"text {i}" for i in range(50)]
+    server = StubServer(delay=0.01)
+
+    result = asyncio.run(server.batch_translate(texts, max_chars=40, max_texts=4))
+
+    assert result == [text.upper() for text in texts]
+    assert len(server.requests) > 1
+    assert all(len(batch) <= 4 and sum(map(len, batch)) <= 40 for batch in server.requests)
+
+
+def test_long_text_is_sent_alone():
+    texts = ["a", "b" * 100, "c"]
+    server = StubServer()
+
+    result = asyncio.run(server.batch_translate(texts, max_chars=10))
+
+    assert result == ["A", "B" * 100, "C"]
+    assert ["b" * 100] in server.requests
+    assert len(server.requests) == 3
+
+
+def test_semaphore_limits_the_concurrent_requests():
+    texts = [f"text {i}" for i in range(20)]
+    server = StubServer(delay=0.02)
+
+    result = asyncio.run(server.batch_translate(texts, max_texts=1, semaphore=asyncio.Semaphore(3)))
+
+    assert result == [text.upper() for text in texts]
+    assert len(server.requests) == 20
+    assert server.peak == 3
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from core.caches import async_cached
+from core.db.persistent_cache import PersistentCache, PersistentCacheStats
+
+
+def test_l2_hit_through_async_cached_is_not_written_back(session_maker: Any):
+    async def scenario():
+        cache = PersistentCache[str, str]("test.l2_hit", expire=60)
+        session_maker.stored = "stored"
+        cache._async_session = session_maker  # pyright: ignore[reportPrivateUsage]
+
+        @async_cached(cache, key=lambda key: key)
+        async def load(key: str) -> str:
+            if (cached := await cache.fetch(key)) is not None:
+                return cached
+            return "computed"
+
+        assert await load("key") == "stored"
+        assert cache._pending == {}  # pyright: ignore[reportPrivateUsage]
+
+        cache["key"] = "changed"
+        assert "key" in cache._pending  # pyright: ignore[reportPrivateUsage]
+
+    asyncio.run(scenario())
+
+
+def test_lookups_through_async_cached_are_counted_once(session_maker: Any):
+    async def scenario(stored: str | None) -> PersistentCacheStats:
+        cache = PersistentCache[str, str]("test.stats", expire=60)
+        session_maker.stored = stored
+        cache._async_session = session_maker  # pyright: ignore[reportPrivateUsage]
+
+        @async_cached(cache, key=lambda key: key)
+        async def load(key: str) -> str:
+            if (cached := await cache.fetch(key)) is not None:
+                return cached
+            return "computed"
+
+        await load("key")  # L1 miss
+        await load("key")  # L1 hit
+        assert isinstance(cache.stats, PersistentCacheStats)
+        return cache.stats
+
+    computed = asyncio.run(scenario(None))
+    assert (computed.hits, computed.misses, computed.l2_hits) == (1, 1, 0)
+    assert computed.hit_ratio == 0.5
+
+    stored = asyncio.run(scenario("stored"))
+    assert (stored.hits, stored.misses, stored.l2_hits) == (1, 1, 1)
+    assert stored.hit_ratio == 1.0
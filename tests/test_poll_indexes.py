@@ -0,0 +1,73 @@
+"""Check that the poll queries use their indexes, using EXPLAIN against a Postgres migrated to the head.
+
+Sequential scans are disabled for the check, so the planner uses an index if one matches, even on small tables.
+The database is set with the POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB and POSTGRES_HOST (localhost) variables, the
+tests are skipped without them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from core.db.tables import Poll, PollAnswer, PollChoice
+
+pytestmark = pytest.mark.skipif(
+    not all(os.environ.get(name) for name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB")),
+    reason="needs a Postgres database, set with the POSTGRES_* variables",
+)
+
+# name: (statement, expected index), the statements are the same as in cogs.poll
+CASES: dict[str, tuple[Select[Any], str]] = {
+    "poll by message": (select(Poll).where(Poll.message_id == 1234), "ix_poll_message_id"),
+    "poll choices": (select(PollChoice).where(PollChoice.poll_id.in_([1, 2])), "ix_poll_choice_poll_id"),
+    "user votes": (
+        select(PollAnswer).where(PollAnswer.poll_id == 1).where(PollAnswer.user_id == 1234),
+        "ix_poll_answer_poll_id_user_id",
+    ),
+    "poll results": (
+        select(PollAnswer.value, func.count())
+        .select_from(PollAnswer)
+        .where(PollAnswer.poll_id == 1)
+        .group_by(PollAnswer.value),
+        "ix_poll_answer_poll_id_value",
+    ),
+}
+
+
+def walk(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from walk(child)
+
+
+async def explain(stmt: Select[Any]) -> list[dict[str, Any]]:
+    url = (
+        f"postgresql+asyncpg://{os.environ['POSTGRES_USER']}:{os.environ['POSTGRES_PASSWORD']}"
+        f"@{os.environ.get('POSTGRES_HOST', 'localhost')}:5432/{os.environ['POSTGRES_DB']}"
+    )
+    engine = create_async_engine(url)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SET enable_seqscan = off"))
+            sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+            raw = (await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar_one()
+    finally:
+        await engine.dispose()
+    return list(walk((json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]))
+
+
+@pytest.mark.parametrize(("stmt", "index"), CASES.values(), ids=CASES.keys())
+def test_query_uses_index(stmt: Select[Any], index: str):
+    nodes = asyncio.run(explain(stmt))
+
+    assert index in {node["Index Name"] for node in nodes if "Index Name" in node}
+    assert not {node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"}
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import json
+
+from core.db.tables import TSSettingUpdate
+from core.db.timeseries import _TableLayout  # pyright: ignore[reportPrivateUsage]
+
+
+def test_missing_value_uses_the_default_factory():
+    layout = _TableLayout(TSSettingUpdate)
+
+    first = dict(zip(layout.columns, layout.record({"guild_id": 1, "user_id": 2})))
+    second = dict(zip(layout.columns, layout.record({"guild_id": 1, "user_id": 2, "data": {"key": "value"}})))
+
+    assert json.loads(first["data"]) == {}
+    assert json.loads(second["data"]) == {"key": "value"}